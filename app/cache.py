@@ -0,0 +1,62 @@
+"""In-process TTL cache for read-mostly query results."""
+import asyncio
+import time
+
+DEFAULT_TTL = 60
+
+_entries: dict = {}
+_generations: dict = {}
+# (kind, key) -> Future of the load currently running for it
+_inflight: dict = {}
+
+
+async def cached_all(kind: str, key, loader, ttl: float = DEFAULT_TTL):
+    """Return the cached value for (kind, key), awaiting `loader()` on a miss.
+    Concurrent misses on the same (kind, key) share one load; different keys load in parallel."""
+    k = (kind, key)
+    while True:
+        entry = _entries.get(k)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+        pending = _inflight.get(k)
+        if pending is None:
+            break
+        try:
+            return await asyncio.shield(pending)
+        except asyncio.CancelledError:
+            if not pending.cancelled():
+                raise  # this request was cancelled
+            # the request running the load went away; load it here instead
+
+    future = asyncio.get_running_loop().create_future()
+    _inflight[k] = future
+    try:
+        generation = version(kind)
+        value = await loader()
+        # a write that landed while we were loading makes this result stale
+        if version(kind) == generation:
+            _entries[k] = (time.monotonic() + ttl, value)
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as exc:
+        future.set_exception(exc)
+        future.exception()  # mark retrieved: there may be no waiters
+        raise
+    else:
+        future.set_result(value)
+        return value
+    finally:
+        del _inflight[k]
+
+
+def version(kind: str) -> tuple:
+    """Changes whenever `kind` (or everything) is invalidated; lets callers cache derived data."""
+    return _generations.get(kind, 0), _generations.get(None, 0)
+
+
+def invalidate(kind: str = None):
+    """Drop cached entries for `kind` (or everything) after a write."""
+    for k in [k for k in _entries if kind is None or k[0] == kind]:
+        del _entries[k]
+    _generations[kind] = _generations.get(kind, 0) + 1
@@ -1,476 +1,627 @@
 """CRUD operations - v3.0"""
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, or_, func
-from app.db import Noun, Verb, Adjective, Phrase, QuestionWord, CustomEntry, CustomCategory
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy import select, insert, update, delete, or_, func, tuple_, table, column, literal_column
+from app import cache
+from app.db import (Noun, Verb, Adjective, Phrase, QuestionWord, CustomEntry, CustomCategory,
+                    async_session_maker, FTS_TABLES, UNIQUE_INDEX_MISSING)
 from typing import Optional
+import asyncio
+import functools
+import random
+import re
+from contextlib import asynccontextmanager
 
 
 # ── LEVELS ──────────────────────────────────────────────────────────────────
 
 LEVELS = ["A", "B1.1", "B1.2", "B2.1", "B2.2"]
 
+# translations_normalized/translations_text are derived by Repo from translations
+NOUN_FIELDS = frozenset({"article", "word", "translations", "translations_normalized", "translations_text",
+                         "definite", "plural", "example_no", "example_bg", "notes", "tags", "group",
+                         "group_description", "level"})
+VERB_FIELDS = frozenset({"infinitive", "presens", "preteritum", "perfect_participle", "translations",
+                         "translations_normalized", "translations_text", "tags", "group", "group_description",
+                         "level"})
+ADJECTIVE_FIELDS = frozenset({"base", "neuter", "plural", "translations", "translations_normalized",
+                              "translations_text", "tags", "group", "group_description", "level"})
+PHRASE_FIELDS = frozenset({"norwegian", "translations", "translations_normalized", "translations_text",
+                           "category", "notes", "level"})
+QUESTION_WORD_FIELDS = frozenset({"norwegian", "translations", "example_no", "example_bg", "notes"})
+
+
+_PARENS = re.compile(r"\s*\(.*?\)\s*")
+
 
 def _normalize(s: str) -> str:
-    import re
-    s = re.sub(r"\s*\(.*?\)\s*", "", s or "")
-    s = re.sub(r"[.!?,;:]+$", "", s.strip())
-    return s.strip().lower()
+    s = s or ""
+    if "(" in s:
+        s = _PARENS.sub("", s)
+    return s.strip().rstrip(".!?,;:").strip().lower()
 
 
-# ── NOUNS ────────────────────────────────────────────────────────────────────
+def normalize_translations(translations) -> list:
+    """Every accepted answer for `translations`, already normalized (stored alongside the row)."""
+    return [_normalize(part) for t in (translations or []) for part in t.split(",")]
 
-async def get_nouns(db: AsyncSession, level: Optional[str] = None):
-    q = select(Noun)
-    if level and level != "all":
-        q = q.where(Noun.level == level)
-    result = await db.execute(q.order_by(Noun.word))
-    return result.scalars().all()
 
+def translation_columns(translations) -> dict:
+    """Columns derived from `translations` on every write: the accepted answers, and a
+    flat lowercase string the search index and LIKE fallback read instead of the JSON."""
+    return {"translations_normalized": normalize_translations(translations),
+            "translations_text": "\x1f".join(translations or []).lower()}
 
-async def get_noun(db: AsyncSession, noun_id: int):
-    result = await db.execute(select(Noun).where(Noun.id == noun_id))
-    return result.scalar_one_or_none()
 
+def _accepted(row) -> list:
+    # rows written before the column existed are backfilled by init_db; this covers any stragglers
+    normalized = getattr(row, "translations_normalized", None)
+    if normalized is not None:
+        return normalized
+    return normalize_translations(row.translations)
 
-async def get_random_noun(db: AsyncSession, exclude_ids: list, level: Optional[str] = None):
-    from sqlalchemy import func
-    q = select(Noun).where(Noun.id.notin_(exclude_ids))
-    if level and level != "all":
-        q = q.where(Noun.level == level)
-    result = await db.execute(q.order_by(func.random()).limit(1))
-    return result.scalar_one_or_none()
 
+# (answer key, model attribute) for each form the practice pages ask for
+VERB_FORMS = (("presens", "presens"), ("preteritum", "preteritum"), ("perfect", "perfect_participle"))
+ADJECTIVE_FORMS = (("neuter", "neuter"), ("plural", "plural"))
 
-async def create_noun(db: AsyncSession, article: str, word: str, translations: list,
-                      definite: str = None, plural: str = None, tags: str = None,
-                      group: str = None, group_description: str = None, level: str = "A"):
-    existing = await db.execute(select(Noun).where(Noun.word == word, Noun.article == article))
-    if existing.scalar_one_or_none():
-        return None
-    noun = Noun(article=article, word=word, translations=translations,
-                definite=definite, plural=plural, tags=tags,
-                group=group, group_description=group_description, level=level or "A")
-    db.add(noun)
-    await db.commit()
-    await db.refresh(noun)
-    return noun
-
-
-async def update_noun(db: AsyncSession, noun_id: int, **kwargs):
-    noun = await get_noun(db, noun_id)
-    if not noun:
+
+@functools.lru_cache(maxsize=2048)
+def _forms_validator(expected: tuple):
+    """Validator for one item's ((answer key, expected form), ...), with the expected
+    forms normalized once; repeat checks of the same item reuse it from the cache."""
+    targets = tuple((key, _normalize(form) if form else None) for key, form in expected)
+
+    def validate(answers: dict) -> dict:
+        results = {}
+        for key, target in targets:
+            given = answers.get(key)
+            # blank expected forms pass
+            results[key] = target is None or bool(given and given.strip()) and _normalize(given) == target
+        return results
+    return validate
+
+
+def _translation_matches(row, given) -> bool:
+    if not given or not given.strip():
+        return False
+    # a row has a handful of accepted answers; scanning them beats building a set per check
+    return _normalize(given) in _accepted(row)
+
+
+def check_forms(row, answers: dict, forms) -> dict:
+    """{answer key: correct?} for each (answer key, attribute) in `forms`."""
+    return _forms_validator(tuple((key, getattr(row, attr)) for key, attr in forms))(answers)
+
+
+@asynccontextmanager
+async def unit_of_work(db: AsyncSession):
+    """Run several create_*/update_*/delete_* calls made with commit=False as one transaction."""
+    try:
+        yield db
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+    finally:
+        cache.invalidate()
+
+
+# SQLite caps the number of bound parameters per statement
+_IN_CHUNK = 500
+
+
+async def _existing_keys(db: AsyncSession, column, keys) -> set:
+    """Return the subset of `keys` already present in `column`, one query per chunk."""
+    keys = list(set(keys))
+    found = set()
+    for i in range(0, len(keys), _IN_CHUNK):
+        result = await db.execute(select(column).where(column.in_(keys[i:i + _IN_CHUNK])))
+        found.update(result.scalars())
+    return found
+
+
+async def _update_row(db: AsyncSession, model, row_id: int, fields: frozenset, kwargs: dict,
+                      commit: bool = True) -> bool:
+    """Single UPDATE ... WHERE id = :id with the known columns from kwargs; True if the row exists."""
+    values = {k: v for k, v in kwargs.items() if k in fields}
+    if not values:
+        return await db.get(model, row_id) is not None
+    stmt = (update(model).where(model.id == row_id).values(**values)
+            .execution_options(synchronize_session=False))
+    try:
+        result = await db.execute(stmt)
+    except IntegrityError:
+        # the new values collide with another row's unique key
+        if not commit:
+            raise
+        await db.rollback()
+        return False
+    if commit:
+        await db.commit()
+    return result.rowcount > 0
+
+
+# Dialects whose INSERT supports ON CONFLICT DO NOTHING
+_CONFLICT_INSERTS = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+
+async def _insert_new(db: AsyncSession, model, values: dict):
+    """INSERT one row and return it, or None when it collides with a unique key."""
+    dialect_insert = _CONFLICT_INSERTS.get(db.bind.dialect.name)
+    if dialect_insert is not None:
+        stmt = dialect_insert(model).values(**values).on_conflict_do_nothing().returning(model)
+        return (await db.execute(stmt)).scalar_one_or_none()
+    try:
+        async with db.begin_nested():
+            return (await db.execute(insert(model).values(**values).returning(model))).scalar_one()
+    except IntegrityError:
         return None
-    for k, v in kwargs.items():
-        if hasattr(noun, k):
-            setattr(noun, k, v)
-    await db.commit()
-    await db.refresh(noun)
-    return noun
-
-
-async def delete_noun(db: AsyncSession, noun_id: int):
-    noun = await get_noun(db, noun_id)
-    if noun:
-        await db.delete(noun)
+
+
+async def _delete_row(db: AsyncSession, model, row_id: int, commit: bool = True) -> bool:
+    result = await db.execute(delete(model).where(model.id == row_id))
+    if commit:
         await db.commit()
-    return noun
+    return result.rowcount > 0
 
 
-async def check_noun_answer(noun: Noun, answer: str) -> bool:
-    if not answer or not answer.strip():
-        return False
-    answer = _normalize(answer)
-    for t in noun.translations:
-        for part in t.split(","):
-            if _normalize(part) == answer:
-                return True
-    return False
-
-
-async def count_nouns(db: AsyncSession, level: Optional[str] = None):
-    q = select(func.count(Noun.id))
-    if level and level != "all":
-        q = q.where(Noun.level == level)
+async def _random_row(db: AsyncSession, model, *criteria):
+    """Pick one random row in a single statement: the OFFSET is a scalar subquery
+    drawing a random number below the match count (ORDER BY random() would sort
+    the whole table on every call)."""
+    count = select(func.count(model.id)).where(*criteria).scalar_subquery()
+    offset = func.abs(func.random() % func.max(count, 1))
+    q = select(model).where(*criteria).order_by(model.id).offset(offset).limit(1)
     result = await db.execute(q)
-    return result.scalar()
+    return result.scalar_one_or_none()
 
 
-# ── VERBS ────────────────────────────────────────────────────────────────────
+class Repo:
+    """CRUD for one table, driven by its model, natural key and cache namespace.
+    The per-kind module functions below are thin wrappers around an instance."""
+
+    def __init__(self, model, kind: str, key: tuple, order_by, fields: frozenset, prepare=None):
+        self.model = model
+        self.kind = kind
+        self.key = key
+        self.order_by = order_by
+        self.fields = fields
+        self.prepare = prepare
+        self.has_level = hasattr(model, "level")
+        self.derives_translations = hasattr(model, "translations_normalized")
+
+    def _criteria(self, level):
+        if self.has_level and level and level != "all":
+            return [self.model.level == level]
+        return []
+
+    def _values(self, values: dict) -> dict:
+        """Fill the derived columns (default level, auto-detected group, translation columns) before an insert."""
+        if self.prepare:
+            values = self.prepare(values)
+        if self.derives_translations:
+            values.update(translation_columns(values.get("translations")))
+        if self.has_level:
+            values["level"] = values.get("level") or "A"
+        return values
+
+    def _row_key(self, values: dict):
+        return tuple(values[k] for k in self.key) if len(self.key) > 1 else values[self.key[0]]
+
+    async def get_all(self, db: AsyncSession, level: Optional[str] = None):
+        level = level if level and level != "all" else None
+
+        async def load():
+            # stream_results: rows are fetched and hydrated batch by batch, not buffered twice
+            return [row async for row in self.iter(db, level)]
+        return await cache.cached_all(self.kind, level, load)
+
+    async def iter(self, db: AsyncSession, level: Optional[str] = None, chunk: int = 500):
+        """Yield rows in chunks of `chunk` instead of buffering the whole table (used by exports)."""
+        q = select(self.model).where(*self._criteria(level)).order_by(self.order_by)
+        result = await db.stream_scalars(q.execution_options(yield_per=chunk))
+        async for row in result:
+            yield row
+
+    async def get_page(self, db: AsyncSession, page: int, size: int):
+        """One page of the full list, in list order (admin tables)."""
+        # id breaks ties in the sort column so OFFSET pages neither repeat nor skip rows
+        q = (select(self.model).order_by(self.order_by, self.model.id)
+             .offset((page - 1) * size).limit(size))
+        result = await db.execute(q)
+        return result.scalars().all()
+
+    async def get(self, db: AsyncSession, row_id: int):
+        return await db.get(self.model, row_id)
+
+    async def ids(self, db: AsyncSession, level: Optional[str] = None) -> list:
+        """All ids (for `level`), cached like get_all; random picks choose from this list."""
+        level = level if level and level != "all" else None
+
+        async def load():
+            result = await db.execute(select(self.model.id).where(*self._criteria(level)))
+            return result.scalars().all()
+        return await cache.cached_all(self.kind, ("ids", level), load)
+
+    async def get_random(self, db: AsyncSession, exclude_ids: list, level: Optional[str] = None):
+        """Choose from the cached id list and load that one row by primary key."""
+        exclude = set(exclude_ids)
+        candidates = [i for i in await self.ids(db, level) if i not in exclude]
+        if not candidates:
+            return None
+        row = await db.get(self.model, random.choice(candidates))
+        if row is None:
+            # deleted since the id list was cached
+            return await _random_row(db, self.model, self.model.id.notin_(list(exclude)), *self._criteria(level))
+        return row
+
+    async def get_random_batch(self, db: AsyncSession, exclude_ids: list, level: Optional[str] = None,
+                               n: int = 20) -> list:
+        """Up to `n` distinct random rows not in `exclude_ids`, loaded with one IN query."""
+        exclude = set(exclude_ids)
+        candidates = [i for i in await self.ids(db, level) if i not in exclude]
+        picked = random.sample(candidates, min(n, len(candidates)))
+        if not picked:
+            return []
+        rows = {row.id: row for row in (await db.execute(
+            select(self.model).where(self.model.id.in_(picked)))).scalars()}
+        return [rows[i] for i in picked if i in rows]
+
+    async def create(self, db: AsyncSession, values: dict, commit: bool = True):
+        """Insert one row; returns None when its key already exists."""
+        if self.model.__tablename__ in UNIQUE_INDEX_MISSING:
+            # no unique index for ON CONFLICT to hit, so look the key up first
+            if await self.existing_keys(db, [self._row_key(values)]):
+                return None
+        obj = await _insert_new(db, self.model, self._values(values))
+        if obj is None:
+            return None  # already exists
+        if commit:
+            await db.commit()
+        cache.invalidate(self.kind)
+        return obj
+
+    async def existing_keys(self, db: AsyncSession, keys: list) -> set:
+        if len(self.key) == 1:
+            return await _existing_keys(db, getattr(self.model, self.key[0]), keys)
+        columns = [getattr(self.model, k) for k in self.key]
+        found = set()
+        keys = list(set(keys))
+        for i in range(0, len(keys), _IN_CHUNK):
+            result = await db.execute(select(*columns).where(tuple_(*columns).in_(keys[i:i + _IN_CHUNK])))
+            found.update(tuple(row) for row in result)
+        return found
+
+    async def create_bulk(self, db: AsyncSession, rows: list, commit: bool = True) -> int:
+        """Insert many rows with one executemany and one commit.
+        Rows already in the table (or repeated in the batch) are skipped; returns the number added."""
+        if not rows:
+            return 0
+        seen = await self.existing_keys(db, [self._row_key(r) for r in rows])
+        new_rows = []
+        for r in rows:
+            key = self._row_key(r)
+            if key in seen:
+                continue
+            seen.add(key)
+            new_rows.append(self._values(dict(r)))
+        if new_rows:
+            await db.execute(insert(self.model), new_rows)
+        if commit:
+            await db.commit()
+        cache.invalidate(self.kind)
+        return len(new_rows)
+
+    async def update(self, db: AsyncSession, row_id: int, commit: bool = True, **kwargs):
+        if self.derives_translations and "translations" in kwargs:
+            kwargs.update(translation_columns(kwargs["translations"]))
+        if not await _update_row(db, self.model, row_id, self.fields, kwargs, commit):
+            return None
+        cache.invalidate(self.kind)
+        # the Core UPDATE bypassed the session, so reload over any copy already in its identity map
+        return await db.get(self.model, row_id, populate_existing=True)
+
+    async def delete(self, db: AsyncSession, row_id: int, commit: bool = True) -> bool:
+        deleted = await _delete_row(db, self.model, row_id, commit)
+        if deleted:
+            cache.invalidate(self.kind)
+        return deleted
+
+    async def count(self, db: AsyncSession, level: Optional[str] = None):
+        level = level if level and level != "all" else None
+
+        async def load():
+            result = await db.execute(select(func.count(self.model.id)).where(*self._criteria(level)))
+            return result.scalar()
+        return await cache.cached_all(self.kind, ("count", level), load)
+
+
+def _with_verb_group(values: dict) -> dict:
+    auto_group, auto_desc = detect_verb_group(values["infinitive"], values.get("preteritum") or "")
+    return {**values, "translations": values.get("translations") or [],
+            "group": values.get("group") or auto_group,
+            "group_description": values.get("group_description") or auto_desc}
+
+
+def _with_adj_group(values: dict) -> dict:
+    auto_group, auto_desc = detect_adj_group(values["base"], values.get("neuter") or "", values.get("plural") or "")
+    return {**values, "translations": values.get("translations") or [],
+            "group": values.get("group") or auto_group,
+            "group_description": values.get("group_description") or auto_desc}
+
+
+nouns = Repo(Noun, "nouns", ("article", "word"), Noun.word, NOUN_FIELDS)
+verbs = Repo(Verb, "verbs", ("infinitive",), Verb.infinitive, VERB_FIELDS, _with_verb_group)
+adjectives = Repo(Adjective, "adjectives", ("base",), Adjective.base, ADJECTIVE_FIELDS, _with_adj_group)
+phrases = Repo(Phrase, "phrases", ("norwegian",), Phrase.norwegian, PHRASE_FIELDS)
+question_words = Repo(QuestionWord, "question_words", ("norwegian",), QuestionWord.norwegian, QUESTION_WORD_FIELDS)
 
-async def get_verbs(db: AsyncSession, level: Optional[str] = None):
-    q = select(Verb)
-    if level and level != "all":
-        q = q.where(Verb.level == level)
-    result = await db.execute(q.order_by(Verb.infinitive))
-    return result.scalars().all()
 
+# ── NOUNS ────────────────────────────────────────────────────────────────────
 
-async def get_verb(db: AsyncSession, verb_id: int):
-    result = await db.execute(select(Verb).where(Verb.id == verb_id))
-    return result.scalar_one_or_none()
+get_nouns = nouns.get_all
+get_nouns_page = nouns.get_page
+get_noun = nouns.get
+get_random_noun = nouns.get_random
+get_random_nouns_batch = nouns.get_random_batch
+existing_noun_keys = nouns.existing_keys
+create_nouns_bulk = nouns.create_bulk
+update_noun = nouns.update
+delete_noun = nouns.delete
+count_nouns = nouns.count
 
 
-async def get_random_verb(db: AsyncSession, exclude_ids: list, level: Optional[str] = None):
-    q = select(Verb).where(Verb.id.notin_(exclude_ids))
-    if level and level != "all":
-        q = q.where(Verb.level == level)
-    result = await db.execute(q.order_by(func.random()).limit(1))
-    return result.scalar_one_or_none()
+async def create_noun(db: AsyncSession, article: str, word: str, translations: list,
+                      definite: str = None, plural: str = None, tags: str = None,
+                      group: str = None, group_description: str = None, level: str = "A", commit: bool = True):
+    return await nouns.create(db, dict(
+        article=article, word=word, translations=translations,
+        definite=definite, plural=plural, tags=tags,
+        group=group, group_description=group_description, level=level), commit)
+
+
+async def check_noun_answer(noun: Noun, answer: str) -> bool:
+    return _translation_matches(noun, answer)
+
+
+# ── VERBS ────────────────────────────────────────────────────────────────────
+
+get_verbs = verbs.get_all
+get_verbs_page = verbs.get_page
+get_verb = verbs.get
+get_random_verb = verbs.get_random
+existing_verb_keys = verbs.existing_keys
+create_verbs_bulk = verbs.create_bulk
+delete_verb = verbs.delete
+count_verbs = verbs.count
 
 
 async def create_verb(db: AsyncSession, infinitive: str, presens: str = None,
                       preteritum: str = None, perfect_participle: str = None,
                       translations: list = None, tags: str = None,
-                      group: str = None, group_description: str = None, level: str = "A"):
-    existing = await db.execute(select(Verb).where(Verb.infinitive == infinitive))
-    if existing.scalar_one_or_none():
-        return None
-    auto_group, auto_desc = detect_verb_group(infinitive, preteritum or "")
-    verb = Verb(infinitive=infinitive, presens=presens, preteritum=preteritum,
-                perfect_participle=perfect_participle, translations=translations or [],
-                tags=tags, group=group or auto_group, group_description=group_description or auto_desc, level=level or "A")
-    db.add(verb)
-    await db.commit()
-    await db.refresh(verb)
-    return verb
-
-
-async def update_verb(db: AsyncSession, verb_id: int, **kwargs):
-    verb = await get_verb(db, verb_id)
-    if not verb:
-        return None
+                      group: str = None, group_description: str = None, level: str = "A", commit: bool = True):
+    return await verbs.create(db, dict(
+        infinitive=infinitive, presens=presens, preteritum=preteritum,
+        perfect_participle=perfect_participle, translations=translations,
+        tags=tags, group=group, group_description=group_description, level=level), commit)
+
+
+async def update_verb(db: AsyncSession, verb_id: int, commit: bool = True, **kwargs):
     if "preteritum" in kwargs and kwargs.get("preteritum"):
-        auto_group, auto_desc = detect_verb_group(verb.infinitive, kwargs["preteritum"])
+        infinitive = kwargs.get("infinitive") or (await db.execute(
+            select(Verb.infinitive).where(Verb.id == verb_id))).scalar()
+        auto_group, auto_desc = detect_verb_group(infinitive or "", kwargs["preteritum"])
         if not kwargs.get("group"):
             kwargs["group"] = auto_group
         if not kwargs.get("group_description"):
             kwargs["group_description"] = auto_desc
-    for k, v in kwargs.items():
-        if hasattr(verb, k):
-            setattr(verb, k, v)
-    await db.commit()
-    await db.refresh(verb)
-    return verb
-
-
-async def delete_verb(db: AsyncSession, verb_id: int):
-    verb = await get_verb(db, verb_id)
-    if verb:
-        await db.delete(verb)
-        await db.commit()
-    return verb
+    return await verbs.update(db, verb_id, commit, **kwargs)
 
 
 async def check_verb_answer(verb: Verb, presens_ans: str, preteritum_ans: str, perfect_ans: str) -> dict:
-    def chk(expected, given):
-        if not expected:
-            return True
-        if not given or not given.strip():
-            return False
-        return _normalize(given) == _normalize(expected)
-    results = {
-        "presens": chk(verb.presens, presens_ans),
-        "preteritum": chk(verb.preteritum, preteritum_ans),
-        "perfect": chk(verb.perfect_participle, perfect_ans),
-    }
+    results = check_forms(verb, {"presens": presens_ans, "preteritum": preteritum_ans,
+                                 "perfect": perfect_ans}, VERB_FORMS)
     results["all_correct"] = all(results.values())
     return results
 
-async def count_verbs(db: AsyncSession, level: Optional[str] = None):
-    q = select(func.count(Verb.id))
-    if level and level != "all":
-        q = q.where(Verb.level == level)
-    result = await db.execute(q)
-    return result.scalar()
-
 
 # ── ADJECTIVES ───────────────────────────────────────────────────────────────
 
-async def get_adjectives(db: AsyncSession, level: Optional[str] = None):
-    q = select(Adjective)
-    if level and level != "all":
-        q = q.where(Adjective.level == level)
-    result = await db.execute(q.order_by(Adjective.base))
-    return result.scalars().all()
-
-
-async def get_adjective(db: AsyncSession, adj_id: int):
-    result = await db.execute(select(Adjective).where(Adjective.id == adj_id))
-    return result.scalar_one_or_none()
-
-
-async def get_random_adjective(db: AsyncSession, exclude_ids: list, level: Optional[str] = None):
-    q = select(Adjective).where(Adjective.id.notin_(exclude_ids))
-    if level and level != "all":
-        q = q.where(Adjective.level == level)
-    result = await db.execute(q.order_by(func.random()).limit(1))
-    return result.scalar_one_or_none()
+get_adjectives = adjectives.get_all
+get_adjectives_page = adjectives.get_page
+get_adjective = adjectives.get
+get_random_adjective = adjectives.get_random
+existing_adjective_keys = adjectives.existing_keys
+create_adjectives_bulk = adjectives.create_bulk
+delete_adjective = adjectives.delete
+count_adjectives = adjectives.count
 
 
 async def create_adjective(db: AsyncSession, base: str, neuter: str = None, plural: str = None,
                            translations: list = None, tags: str = None,
-                           group: str = None, group_description: str = None, level: str = "A"):
-    existing = await db.execute(select(Adjective).where(Adjective.base == base))
-    if existing.scalar_one_or_none():
-        return None
-    auto_group, auto_desc = detect_adj_group(base, neuter or "", plural or "")
-    adj = Adjective(base=base, neuter=neuter, plural=plural, translations=translations or [],
-                tags=tags, group=group or auto_group,
-                group_description=group_description or auto_desc, level=level or "A")
-    db.add(adj)
-    await db.commit()
-    await db.refresh(adj)
-    return adj
-
-
-async def update_adjective(db: AsyncSession, adj_id: int, **kwargs):
-    adj = await get_adjective(db, adj_id)
-    if not adj:
-        return None
+                           group: str = None, group_description: str = None, level: str = "A", commit: bool = True):
+    return await adjectives.create(db, dict(
+        base=base, neuter=neuter, plural=plural, translations=translations,
+        tags=tags, group=group, group_description=group_description, level=level), commit)
+
+
+async def update_adjective(db: AsyncSession, adj_id: int, commit: bool = True, **kwargs):
     if "base" in kwargs or "neuter" in kwargs or "plural" in kwargs:
+        forms = {k: kwargs[k] for k in ("base", "neuter", "plural") if k in kwargs}
+        missing = [k for k in ("base", "neuter", "plural") if k not in forms]
+        if missing:
+            row = (await db.execute(select(*(getattr(Adjective, k) for k in missing))
+                                    .where(Adjective.id == adj_id))).first()
+            forms.update(zip(missing, row or ()))
         auto_group, auto_desc = detect_adj_group(
-            kwargs.get("base", adj.base),
-            kwargs.get("neuter", adj.neuter or ""),
-            kwargs.get("plural", adj.plural or "")
+            forms.get("base"),
+            forms.get("neuter") or "",
+            forms.get("plural") or ""
         )
         if not kwargs.get("group"):
             kwargs["group"] = auto_group
         if not kwargs.get("group_description"):
             kwargs["group_description"] = auto_desc
-    for k, v in kwargs.items():
-        if hasattr(adj, k):
-            setattr(adj, k, v)
-    await db.commit()
-    await db.refresh(adj)
-    return adj
-
-
-async def delete_adjective(db: AsyncSession, adj_id: int):
-    adj = await get_adjective(db, adj_id)
-    if adj:
-        await db.delete(adj)
-        await db.commit()
-    return adj
+    return await adjectives.update(db, adj_id, commit, **kwargs)
 
 
 async def check_adjective_answer(adj: Adjective, neuter_ans: str, plural_ans: str, translation_ans: str) -> dict:
-    def chk(expected, given):
-        if not expected:
-            return True
-        if not given or not given.strip():
-            return False
-        return _normalize(given) == _normalize(expected)
-    def chk_translation(given):
-        if not given or not given.strip():
-            return False
-        given_n = _normalize(given)
-        for t in (adj.translations or []):
-            for part in t.split(","):
-                if _normalize(part) == given_n:
-                    return True
-        return False
-    return {
-        "neuter": chk(adj.neuter, neuter_ans),
-        "plural": chk(adj.plural, plural_ans),
-        "translation": chk_translation(translation_ans),
-    }
-
-
-async def count_adjectives(db: AsyncSession, level: Optional[str] = None):
-    q = select(func.count(Adjective.id))
-    if level and level != "all":
-        q = q.where(Adjective.level == level)
-    result = await db.execute(q)
-    return result.scalar()
+    results = check_forms(adj, {"neuter": neuter_ans, "plural": plural_ans}, ADJECTIVE_FORMS)
+    results["translation"] = _translation_matches(adj, translation_ans)
+    return results
 
 
 # ── PHRASES ──────────────────────────────────────────────────────────────────
 
-async def get_phrases(db: AsyncSession, level: Optional[str] = None):
-    q = select(Phrase)
-    if level and level != "all":
-        q = q.where(Phrase.level == level)
-    result = await db.execute(q.order_by(Phrase.norwegian))
-    return result.scalars().all()
-
-
-async def get_phrase(db: AsyncSession, phrase_id: int):
-    result = await db.execute(select(Phrase).where(Phrase.id == phrase_id))
-    return result.scalar_one_or_none()
-
-
-async def get_random_phrase(db: AsyncSession, exclude_ids: list, level: Optional[str] = None):
-    q = select(Phrase).where(Phrase.id.notin_(exclude_ids))
-    if level and level != "all":
-        q = q.where(Phrase.level == level)
-    result = await db.execute(q.order_by(func.random()).limit(1))
-    return result.scalar_one_or_none()
+get_phrases = phrases.get_all
+get_phrases_page = phrases.get_page
+get_phrase = phrases.get
+get_random_phrase = phrases.get_random
+existing_phrase_keys = phrases.existing_keys
+create_phrases_bulk = phrases.create_bulk
+update_phrase = phrases.update
+delete_phrase = phrases.delete
+count_phrases = phrases.count
 
 
 async def create_phrase(db: AsyncSession, norwegian: str, translations: list,
-                        category: str = None, notes: str = None, level: str = "A"):
-    existing = await db.execute(select(Phrase).where(Phrase.norwegian == norwegian))
-    if existing.scalar_one_or_none():
-        return None
-    phrase = Phrase(norwegian=norwegian, translations=translations,
-                    category=category, notes=notes, level=level or "A")
-    db.add(phrase)
-    await db.commit()
-    await db.refresh(phrase)
-    return phrase
-
-
-async def update_phrase(db: AsyncSession, phrase_id: int, **kwargs):
-    phrase = await get_phrase(db, phrase_id)
-    if not phrase:
-        return None
-    for k, v in kwargs.items():
-        if hasattr(phrase, k):
-            setattr(phrase, k, v)
-    await db.commit()
-    await db.refresh(phrase)
-    return phrase
-
-
-async def delete_phrase(db: AsyncSession, phrase_id: int):
-    phrase = await get_phrase(db, phrase_id)
-    if phrase:
-        await db.delete(phrase)
-        await db.commit()
-    return phrase
+                        category: str = None, notes: str = None, level: str = "A", commit: bool = True):
+    return await phrases.create(db, dict(
+        norwegian=norwegian, translations=translations,
+        category=category, notes=notes, level=level), commit)
 
 
 async def check_phrase_answer(phrase: Phrase, answer: str) -> bool:
-    if not answer or not answer.strip():
-        return False
-    answer = _normalize(answer)
-    for t in phrase.translations:
-        for part in t.split(","):
-            if _normalize(part) == answer:
-                return True
-    return False
-
-
-async def count_phrases(db: AsyncSession, level: Optional[str] = None):
-    q = select(func.count(Phrase.id))
-    if level and level != "all":
-        q = q.where(Phrase.level == level)
-    result = await db.execute(q)
-    return result.scalar()
+    return _translation_matches(phrase, answer)
 
 
 # ── QUESTION WORDS ───────────────────────────────────────────────────────────
 
-async def get_question_words(db: AsyncSession):
-    result = await db.execute(select(QuestionWord).order_by(QuestionWord.norwegian))
-    return result.scalars().all()
+get_question_words = question_words.get_all
+get_question_word = question_words.get
+get_random_question_word = question_words.get_random
+update_question_word = question_words.update
+delete_question_word = question_words.delete
+count_question_words = question_words.count
 
 
-async def get_question_word(db: AsyncSession, qw_id: int):
-    result = await db.execute(select(QuestionWord).where(QuestionWord.id == qw_id))
-    return result.scalar_one_or_none()
+async def create_question_word(db: AsyncSession, norwegian: str, translations: list,
+                               example_no: str = None, example_bg: str = None, notes: str = None, commit: bool = True):
+    # norwegian has no unique index here, so the insert cannot rely on ON CONFLICT
+    existing = await db.execute(select(QuestionWord.id).where(QuestionWord.norwegian == norwegian))
+    if existing.first():
+        return None
+    result = await db.execute(insert(QuestionWord).values(
+        norwegian=norwegian, translations=translations,
+        example_no=example_no, example_bg=example_bg, notes=notes).returning(QuestionWord))
+    qw = result.scalar_one()
+    if commit:
+        await db.commit()
+    cache.invalidate("question_words")
+    return qw
 
 
-async def get_random_question_word(db: AsyncSession, exclude_ids: list):
-    q = select(QuestionWord).where(QuestionWord.id.notin_(exclude_ids))
-    result = await db.execute(q.order_by(func.random()).limit(1))
-    return result.scalar_one_or_none()
+async def check_question_word_answer(qw: QuestionWord, answer: str) -> bool:
+    return _translation_matches(qw, answer)
 
 
-async def create_question_word(db: AsyncSession, norwegian: str, translations: list,
-                               example_no: str = None, example_bg: str = None, notes: str = None):
-    existing = await db.execute(select(QuestionWord).where(QuestionWord.norwegian == norwegian))
-    if existing.scalar_one_or_none():
-        return None
-    qw = QuestionWord(norwegian=norwegian, translations=translations,
-                      example_no=example_no, example_bg=example_bg, notes=notes)
-    db.add(qw)
-    await db.commit()
-    await db.refresh(qw)
-    return qw
+# ── MIXED PRACTICE ───────────────────────────────────────────────────────────
 
+_RANDOM_PICKERS = {
+    "noun": nouns.get_random,
+    "verb": verbs.get_random,
+    "adjective": adjectives.get_random,
+    "phrase": phrases.get_random,
+    "question_word": question_words.get_random,
+}
 
-async def update_question_word(db: AsyncSession, qw_id: int, **kwargs):
-    qw = await get_question_word(db, qw_id)
-    if not qw:
-        return None
-    for k, v in kwargs.items():
-        if hasattr(qw, k):
-            setattr(qw, k, v)
-    await db.commit()
-    await db.refresh(qw)
-    return qw
 
+async def random_set(kinds: list, excludes: Optional[dict] = None, level: Optional[str] = None) -> dict:
+    """Pick one random item for each kind concurrently, e.g. {"noun": Noun, "verb": Verb}.
+    An AsyncSession must not run statements concurrently, so every pick opens its
+    own short-lived session instead of taking the request's one."""
+    excludes = excludes or {}
 
-async def delete_question_word(db: AsyncSession, qw_id: int):
-    qw = await get_question_word(db, qw_id)
-    if qw:
-        await db.delete(qw)
-        await db.commit()
-    return qw
+    async def pick(kind):
+        async with async_session_maker() as db:
+            return await _RANDOM_PICKERS[kind](db, excludes.get(kind, []), level)
+    items = await asyncio.gather(*(pick(kind) for kind in kinds))
+    return dict(zip(kinds, items))
 
 
-async def check_question_word_answer(qw: QuestionWord, answer: str) -> bool:
-    if not answer or not answer.strip():
-        return False
-    answer = _normalize(answer)
-    for t in qw.translations:
-        for part in t.split(","):
-            if _normalize(part) == answer:
-                return True
-    return False
+# ── COUNTS ───────────────────────────────────────────────────────────────────
 
+async def count_all() -> dict:
+    """Row counts for every kind, e.g. {"nouns": 120, ...}. Each count is cached per kind;
+    misses run concurrently, one session per count (see random_set)."""
+    repos = (nouns, verbs, adjectives, phrases, question_words)
 
-async def count_question_words(db: AsyncSession):
-    result = await db.execute(select(func.count(QuestionWord.id)))
-    return result.scalar()
+    async def count(repo):
+        async with async_session_maker() as db:
+            return await repo.count(db)
+    counts = await asyncio.gather(*(count(repo) for repo in repos))
+    return {repo.kind: n for repo, n in zip(repos, counts)}
 
 
 # ── SEARCH ───────────────────────────────────────────────────────────────────
 
-async def search_all(db: AsyncSession, query: str):
+def _search_filter(model, name_col, query: str):
+    """WHERE clause matching `query` anywhere in the Norwegian column or the translations.
+    Uses the trigram FTS index when there is one; trigrams need at least 3 characters."""
+    name = model.__tablename__
+    if name in FTS_TABLES and len(query) >= 3:
+        fts = table(f"{name}_fts", column("rowid"))
+        phrase = '"' + query.replace('"', '""') + '"'
+        return model.id.in_(select(fts.c.rowid).where(literal_column(fts.name).op("MATCH")(phrase)))
+    return or_(name_col.ilike(f"%{query}%"), model.translations_text.like(f"%{query.lower()}%"))
+
+
+async def search_all(query: str):
+    """Search every kind; the six queries are independent, so they run concurrently,
+    each in its own session (see random_set)."""
     q = f"%{query}%"
-    results = []
+    statements = [
+        select(Noun.id, Noun.article, Noun.word, Noun.translations, Noun.level)
+        .where(_search_filter(Noun, Noun.word, query)).limit(20),
+        select(Verb.id, Verb.infinitive, Verb.translations, Verb.level)
+        .where(_search_filter(Verb, Verb.infinitive, query)).limit(20),
+        select(Adjective.id, Adjective.base, Adjective.translations, Adjective.level)
+        .where(_search_filter(Adjective, Adjective.base, query)).limit(20),
+        select(Phrase.id, Phrase.norwegian, Phrase.translations, Phrase.level)
+        .where(_search_filter(Phrase, Phrase.norwegian, query)).limit(20),
+        select(QuestionWord.id, QuestionWord.norwegian, QuestionWord.translations).where(
+            or_(QuestionWord.norwegian.ilike(q), QuestionWord.translations.cast(String).ilike(q))
+        ).limit(10),
+        select(CustomEntry.id, CustomEntry.norwegian, CustomEntry.translations, CustomEntry.level)
+        .join(CustomCategory, CustomEntry.category_id == CustomCategory.id).where(
+            or_(CustomEntry.norwegian.ilike(q), CustomEntry.translations.cast(String).ilike(q))
+        ).limit(20),
+    ]
+
+    async def fetch(stmt):
+        async with async_session_maker() as db:
+            return (await db.execute(stmt)).all()
+    nouns, verbs, adjs, phrases, qwords, entries = await asyncio.gather(*(fetch(stmt) for stmt in statements))
 
-    nouns = await db.execute(select(Noun).where(
-        or_(Noun.word.ilike(q), Noun.translations.cast(String).ilike(q))
-    ).limit(20))
-    for n in nouns.scalars():
+    results = []
+    for n in nouns:
         results.append({"type": "noun", "norwegian": f"{n.article} {n.word}",
                          "translations": n.translations, "level": n.level, "id": n.id})
-
-    verbs = await db.execute(select(Verb).where(
-        or_(Verb.infinitive.ilike(q), Verb.translations.cast(String).ilike(q))
-    ).limit(20))
-    for v in verbs.scalars():
+    for v in verbs:
         results.append({"type": "verb", "norwegian": v.infinitive,
                          "translations": v.translations, "level": v.level, "id": v.id})
-
-    adjs = await db.execute(select(Adjective).where(
-        or_(Adjective.base.ilike(q), Adjective.translations.cast(String).ilike(q))
-    ).limit(20))
-    for a in adjs.scalars():
+    for a in adjs:
         results.append({"type": "adjective", "norwegian": a.base,
                          "translations": a.translations, "level": a.level, "id": a.id})
-
-    phrases = await db.execute(select(Phrase).where(
-        or_(Phrase.norwegian.ilike(q), Phrase.translations.cast(String).ilike(q))
-    ).limit(20))
-    for p in phrases.scalars():
+    for p in phrases:
         results.append({"type": "phrase", "norwegian": p.norwegian,
                          "translations": p.translations, "level": p.level, "id": p.id})
-
-    qwords = await db.execute(select(QuestionWord).where(
-        or_(QuestionWord.norwegian.ilike(q), QuestionWord.translations.cast(String).ilike(q))
-    ).limit(10))
-    for qw in qwords.scalars():
+    for qw in qwords:
         results.append({"type": "question_word", "norwegian": qw.norwegian,
                          "translations": qw.translations, "level": "—", "id": qw.id})
-
-    entries = await db.execute(select(CustomEntry).join(CustomCategory, CustomEntry.category_id == CustomCategory.id).where(
-        or_(CustomEntry.norwegian.ilike(q), CustomEntry.translations.cast(String).ilike(q))
-    ).limit(20))
-    for e in entries.scalars():
+    for e in entries:
         results.append({"type": "custom", "norwegian": e.norwegian,
                          "translations": e.translations, "level": e.level, "id": e.id})
     return results
@@ -1,13 +1,27 @@
 """Database models - v4.0"""
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy import Column, Integer, String, Text, JSON, DateTime
+from sqlalchemy import Column, Integer, String, Text, JSON, DateTime, Index, event
+from sqlalchemy.dialects.postgresql import JSONB
 from datetime import datetime
+import logging
 import app.settings as settings
 
+logger = logging.getLogger(__name__)
+
 DEFAULT_LEVEL = "A"
+
+# Word tables with a trigram FTS5 index over (key column, translations_text); filled by init_db
+FTS_COLUMNS = {"nouns": "word", "verbs": "infinitive", "adjectives": "base", "phrases": "norwegian"}
+FTS_TABLES: set = set()
+# Word tables whose unique key index could not be created (existing duplicates); filled by init_db
+UNIQUE_INDEX_MISSING: set = set()
 LEVELS = ["A", "B1.1", "B1.2", "B2.1", "B2.2"]
 
+# Plain JSON on SQLite; stored pre-parsed as JSONB if the app is pointed at Postgres
+Translations = JSON().with_variant(JSONB(), "postgresql")
+
 
 class Base(DeclarativeBase):
     pass
@@ -15,10 +29,13 @@ class Base(DeclarativeBase):
 
 class Noun(Base):
     __tablename__ = "nouns"
+    __table_args__ = (Index("ix_nouns_word_article", "word", "article", unique=True),)
     id          = Column(Integer, primary_key=True, index=True)
     article     = Column(String(10), nullable=False)
-    word        = Column(String(200), nullable=False, index=True)
-    translations = Column(JSON, nullable=False)
+    word        = Column(String(200), nullable=False)
+    translations = Column(Translations, nullable=False)
+    translations_normalized = Column(Translations, nullable=True)
+    translations_text = Column(Text, nullable=True)
     definite    = Column(String(200), nullable=True)
     plural      = Column(String(200), nullable=True)
     example_no  = Column(String(500), nullable=True)
@@ -27,51 +44,60 @@ class Noun(Base):
     tags        = Column(String(500), nullable=True)
     group       = Column(String(200), nullable=True)
     group_description = Column(String(500), nullable=True)
-    level       = Column(String(10), nullable=False, default=DEFAULT_LEVEL, server_default="A")
+    level       = Column(String(10), nullable=False, default=DEFAULT_LEVEL, server_default="A", index=True)
 
 
 class Verb(Base):
     __tablename__ = "verbs"
+    __table_args__ = (Index("uq_verbs_infinitive", "infinitive", unique=True),)
     id          = Column(Integer, primary_key=True, index=True)
-    infinitive  = Column(String(200), nullable=False, index=True)
+    infinitive  = Column(String(200), nullable=False)
     presens     = Column(String(200), nullable=True)
     preteritum  = Column(String(200), nullable=True)
     perfect_participle = Column(String(200), nullable=True)
-    translations = Column(JSON, nullable=False)
+    translations = Column(Translations, nullable=False)
+    translations_normalized = Column(Translations, nullable=True)
+    translations_text = Column(Text, nullable=True)
     tags        = Column(String(500), nullable=True)
     group       = Column(String(200), nullable=True)
     group_description = Column(String(500), nullable=True)
-    level       = Column(String(10), nullable=False, default=DEFAULT_LEVEL, server_default="A")
+    level       = Column(String(10), nullable=False, default=DEFAULT_LEVEL, server_default="A", index=True)
 
 
 class Adjective(Base):
     __tablename__ = "adjectives"
+    __table_args__ = (Index("uq_adjectives_base", "base", unique=True),)
     id          = Column(Integer, primary_key=True, index=True)
-    base        = Column(String(200), nullable=False, index=True)
+    base        = Column(String(200), nullable=False)
     neuter      = Column(String(200), nullable=True)
     plural      = Column(String(200), nullable=True)
-    translations = Column(JSON, nullable=False)
+    translations = Column(Translations, nullable=False)
+    translations_normalized = Column(Translations, nullable=True)
+    translations_text = Column(Text, nullable=True)
     tags        = Column(String(500), nullable=True)
     group       = Column(String(200), nullable=True)
     group_description = Column(String(500), nullable=True)
-    level       = Column(String(10), nullable=False, default=DEFAULT_LEVEL, server_default="A")
+    level       = Column(String(10), nullable=False, default=DEFAULT_LEVEL, server_default="A", index=True)
 
 
 class Phrase(Base):
     __tablename__ = "phrases"
+    __table_args__ = (Index("uq_phrases_norwegian", "norwegian", unique=True),)
     id          = Column(Integer, primary_key=True, index=True)
-    norwegian   = Column(String(500), nullable=False, index=True)
-    translations = Column(JSON, nullable=False)
+    norwegian   = Column(String(500), nullable=False)
+    translations = Column(Translations, nullable=False)
+    translations_normalized = Column(Translations, nullable=True)
+    translations_text = Column(Text, nullable=True)
     category    = Column(String(200), nullable=True)
     notes       = Column(Text, nullable=True)
-    level       = Column(String(10), nullable=False, default=DEFAULT_LEVEL, server_default="A")
+    level       = Column(String(10), nullable=False, default=DEFAULT_LEVEL, server_default="A", index=True)
 
 
 class QuestionWord(Base):
     __tablename__ = "question_words"
     id          = Column(Integer, primary_key=True, index=True)
     norwegian   = Column(String(200), nullable=False, index=True)
-    translations = Column(JSON, nullable=False)
+    translations = Column(Translations, nullable=False)
     example_no  = Column(String(500), nullable=True)
     example_bg  = Column(String(500), nullable=True)
     notes       = Column(Text, nullable=True)
@@ -91,13 +117,38 @@ class CustomEntry(Base):
     id          = Column(Integer, primary_key=True, index=True)
     category_id = Column(Integer, nullable=False)
     norwegian   = Column(String(500), nullable=False, index=True)
-    translations = Column(JSON, nullable=False)
-    level       = Column(String(10), nullable=False, default="A", server_default="A")
+    translations = Column(Translations, nullable=False)
+    level       = Column(String(10), nullable=False, default="A", server_default="A", index=True)
 
 
 import json
-engine = create_async_engine(settings.DATABASE_URL, echo=False, json_serializer=lambda obj: json.dumps(obj, ensure_ascii=False))
-async_session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+engine = create_async_engine(
+    settings.DATABASE_URL, echo=False,
+    json_serializer=lambda obj: json.dumps(obj, ensure_ascii=False),
+    # room for every statement shape the routers issue in the compiled-SQL cache
+    query_cache_size=1200,
+    # sqlite3 keeps this many prepared statements per connection (default 128)
+    connect_args={"cached_statements": 512},
+    # keep connections (and their prepared statements) open between requests
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+)
+
+
+if engine.dialect.name == "sqlite":
+    @event.listens_for(engine.sync_engine, "connect")
+    def _sqlite_pragmas(dbapi_conn, _record):
+        # synchronous=NORMAL is durable enough under WAL and skips an fsync per commit
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute(f"PRAGMA mmap_size={settings.SQLITE_MMAP_SIZE}")
+        cursor.execute(f"PRAGMA cache_size=-{settings.SQLITE_CACHE_KB}")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+
+async_session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False, autoflush=False)
 
 
 async def get_db():
@@ -105,7 +156,54 @@ async def get_db():
         yield session
 
 
+async def _create_fts(conn):
+    """External-content FTS5 tables kept in sync by triggers, so substring search
+    hits an index instead of scanning every row with LIKE '%q%'."""
+    from sqlalchemy import text
+    from sqlalchemy.exc import OperationalError
+    for table, col in FTS_COLUMNS.items():
+        fts = f"{table}_fts"
+        existing = (await conn.execute(text("SELECT sql FROM sqlite_master WHERE name = :n"), {"n": fts})).scalar()
+        if existing and "translations_text" not in existing:
+            # first version indexed the JSON translations column; rebuild over translations_text
+            await conn.execute(text(f"DROP TABLE {fts}"))
+            for suffix in ("ai", "ad", "au"):
+                await conn.execute(text(f"DROP TRIGGER IF EXISTS {fts}_{suffix}"))
+            existing = None
+        if not existing:
+            try:
+                await conn.execute(text(
+                    f"CREATE VIRTUAL TABLE {fts} USING fts5({col}, translations_text, "
+                    f"content='{table}', content_rowid='id', tokenize='trigram')"))
+            except OperationalError as e:
+                # no FTS5/trigram in this SQLite build — search falls back to LIKE
+                logger.warning("No FTS index for %s, search will scan with LIKE: %s", table, e.orig)
+                continue
+            await conn.execute(text(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')"))
+        await conn.execute(text(
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN "
+            f"INSERT INTO {fts}(rowid, {col}, translations_text) "
+            f"VALUES (new.id, new.{col}, new.translations_text); END"))
+        await conn.execute(text(
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN "
+            f"INSERT INTO {fts}({fts}, rowid, {col}, translations_text) "
+            f"VALUES ('delete', old.id, old.{col}, old.translations_text); END"))
+        await conn.execute(text(
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {col}, translations_text ON {table} BEGIN "
+            f"INSERT INTO {fts}({fts}, rowid, {col}, translations_text) "
+            f"VALUES ('delete', old.id, old.{col}, old.translations_text); "
+            f"INSERT INTO {fts}(rowid, {col}, translations_text) "
+            f"VALUES (new.id, new.{col}, new.translations_text); END"))
+        FTS_TABLES.add(table)
+
+
 async def init_db():
+    if engine.dialect.name == "sqlite":
+        # WAL lets readers run during an import and commits append to the log instead of
+        # rewriting pages; the mode is stored in the database file, so once is enough
+        async with engine.connect() as conn:
+            await conn.exec_driver_sql("PRAGMA journal_mode=WAL")
+
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
@@ -124,9 +222,66 @@ async def init_db():
             # example columns on nouns
             ("nouns",       "ALTER TABLE nouns ADD COLUMN example_no VARCHAR(500)"),
             ("nouns",       "ALTER TABLE nouns ADD COLUMN example_bg VARCHAR(500)"),
+            # pre-normalized answers for the practice checks
+            ("nouns",       "ALTER TABLE nouns ADD COLUMN translations_normalized JSON"),
+            ("verbs",       "ALTER TABLE verbs ADD COLUMN translations_normalized JSON"),
+            ("adjectives",  "ALTER TABLE adjectives ADD COLUMN translations_normalized JSON"),
+            ("phrases",     "ALTER TABLE phrases ADD COLUMN translations_normalized JSON"),
+            # flat lowercase translations for search
+            ("nouns",       "ALTER TABLE nouns ADD COLUMN translations_text TEXT"),
+            ("verbs",       "ALTER TABLE verbs ADD COLUMN translations_text TEXT"),
+            ("adjectives",  "ALTER TABLE adjectives ADD COLUMN translations_text TEXT"),
+            ("phrases",     "ALTER TABLE phrases ADD COLUMN translations_text TEXT"),
+            # level indexes (practice and count queries filter on level)
+            ("nouns",       "CREATE INDEX IF NOT EXISTS ix_nouns_level ON nouns (level)"),
+            ("verbs",       "CREATE INDEX IF NOT EXISTS ix_verbs_level ON verbs (level)"),
+            ("adjectives",  "CREATE INDEX IF NOT EXISTS ix_adjectives_level ON adjectives (level)"),
+            ("phrases",     "CREATE INDEX IF NOT EXISTS ix_phrases_level ON phrases (level)"),
+            ("custom_entries", "CREATE INDEX IF NOT EXISTS ix_custom_entries_level ON custom_entries (level)"),
         ]
         for _table, stmt in migrations:
             try:
                 await conn.execute(text(stmt))
             except Exception:
                 pass  # column already exists — safe to ignore
+
+        # Unique lookup indexes that replace older single-column ones
+        unique_indexes = [
+            ("nouns",      "CREATE UNIQUE INDEX IF NOT EXISTS ix_nouns_word_article ON nouns (word, article)", "ix_nouns_word"),
+            ("verbs",      "CREATE UNIQUE INDEX IF NOT EXISTS uq_verbs_infinitive ON verbs (infinitive)", "ix_verbs_infinitive"),
+            ("adjectives", "CREATE UNIQUE INDEX IF NOT EXISTS uq_adjectives_base ON adjectives (base)", "ix_adjectives_base"),
+            ("phrases",    "CREATE UNIQUE INDEX IF NOT EXISTS uq_phrases_norwegian ON phrases (norwegian)", "ix_phrases_norwegian"),
+        ]
+        for table, stmt, old_index in unique_indexes:
+            try:
+                await conn.execute(text(stmt))
+            except Exception as e:
+                # existing duplicates — keep the old index; creates check for the key first instead
+                logger.warning("Could not create the unique index on %s, remove its duplicate rows: %s",
+                               table, e)
+                UNIQUE_INDEX_MISSING.add(table)
+                continue
+            UNIQUE_INDEX_MISSING.discard(table)
+            await conn.execute(text(f"DROP INDEX IF EXISTS {old_index}"))
+
+        # Fill the derived translation columns for rows written before they existed
+        # (before the FTS rebuild, which reads translations_text)
+        from sqlalchemy import select, update, bindparam, or_
+        from app.crud import translation_columns
+        for model in (Noun, Verb, Adjective, Phrase):
+            rows = (await conn.execute(select(model.id, model.translations).where(
+                or_(model.translations_normalized.is_(None), model.translations_text.is_(None))))).all()
+            if rows:
+                params = []
+                for r in rows:
+                    cols = translation_columns(r.translations)
+                    params.append({"row_id": r.id, "normalized": cols["translations_normalized"],
+                                   "flat": cols["translations_text"]})
+                table = model.__table__
+                await conn.execute(
+                    update(table).where(table.c.id == bindparam("row_id"))
+                    .values(translations_normalized=bindparam("normalized"), translations_text=bindparam("flat")),
+                    params)
+
+        if engine.dialect.name == "sqlite":
+            await _create_fts(conn)
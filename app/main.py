@@ -1,9 +1,11 @@
 """Norsk Drill v3.0 – main entry point"""
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from contextlib import asynccontextmanager
 from app.db import init_db
-from app.routers import practice, admin, custom_categories
+from app.templating import preload as preload_templates
+from app.routers import practice, admin, custom_categories, search
 import sys
 sys.path.insert(0, "/home/spoder/Projects/norsk-drill")
 from piper_tts import router as tts_router
@@ -12,9 +14,10 @@ import os
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await init_db()
+    preload_templates()
     yield
 
-app = FastAPI(title="Norsk Drill", version="3.0", lifespan=lifespan)
+app = FastAPI(title="Norsk Drill", version="3.0", lifespan=lifespan, default_response_class=ORJSONResponse)
 
 if os.path.isdir("static"):
     app.mount("/static", StaticFiles(directory="static"), name="static")
@@ -22,4 +25,5 @@ if os.path.isdir("static"):
 app.include_router(practice.router)
 app.include_router(admin.router)
 app.include_router(tts_router)
-app.include_router(custom_categories.router)
\ No newline at end of file
+app.include_router(custom_categories.router)
+app.include_router(search.router)
\ No newline at end of file
@@ -1,43 +1,231 @@
 """Admin router - v3.0"""
-from fastapi import APIRouter, Request, Depends, Form, UploadFile, File
-from fastapi.responses import HTMLResponse, RedirectResponse, JSONResponse
-from fastapi.templating import Jinja2Templates
+from fastapi import APIRouter, Request, Depends, Form, UploadFile, File, BackgroundTasks
+from fastapi.responses import HTMLResponse, RedirectResponse, ORJSONResponse, StreamingResponse
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.db import get_db, LEVELS, CustomCategory, CustomEntry, Noun
+from app.db import get_db, async_session_maker, LEVELS, CustomCategory, CustomEntry, Noun
 from sqlalchemy import select
 import app.crud as crud
-import csv, io, json
+from app import cache
+import csv, io, logging, re, uuid
+from app.templating import templates
 
 router = APIRouter(prefix="/admin")
-templates = Jinja2Templates(directory="app/templates")
+logger = logging.getLogger(__name__)
+
+
+_TRANS_SPLIT = re.compile(r"\s*[|,]\s*")
 
 
 def _parse_translations(s: str) -> list:
-    return [t.strip() for t in s.replace("|", ",").split(",") if t.strip()]
+    return [t for t in _TRANS_SPLIT.split(s.strip()) if t]
+
+
+# "norsk – oversettelse": split on the first en dash, or on the first hyphen if the line has none
+_LINE = re.compile(r"\s*(?:([^–]*?)\s*–|([^–]*?)\s*-)\s*(.*?)\s*")
+
+
+def _split_line(line: str):
+    """Return (norwegian, translation) for one import line, or None if it has no separator."""
+    m = _LINE.fullmatch(line)
+    if not m:
+        return None
+    return (m.group(1) if m.group(1) is not None else m.group(2)), m.group(3)
+
+
+_ARTICLES = frozenset(("en", "ei", "et"))
+
+
+def _noun_forms(norwegian: str):
+    words = norwegian.split()
+    if len(words) < 2:
+        return None
+    # Normalize article - replace lookalike cyrillic chars with latin
+    article = words[0].lower()
+    article = article.replace("е", "e").replace("і", "i")  # cyrillic lookalikes
+    if article not in _ARTICLES:
+        return None
+    return {"article": article, "word": " ".join(words[1:])}
+
+
+def _verb_forms(norwegian: str):
+    # Parse optional conjugations: å gå | går | gikk | gått
+    conj_parts = [p.strip() for p in norwegian.split("|")] + [None] * 3
+    return {"infinitive": conj_parts[0], "presens": conj_parts[1],
+            "preteritum": conj_parts[2], "perfect_participle": conj_parts[3]}
+
+
+def _adjective_forms(norwegian: str):
+    conj_parts = [p.strip() for p in norwegian.split("|")] + [None] * 2
+    return {"base": conj_parts[0], "neuter": conj_parts[1], "plural": conj_parts[2]}
+
+
+def _phrase_forms(norwegian: str):
+    return {"norwegian": norwegian}
+
+
+def _parse_text(text_data: str, parse_forms, level: str) -> list:
+    rows = []
+    for line in text_data.splitlines():
+        parsed = _split_line(line)
+        if not parsed:
+            continue
+        norwegian, translation = parsed
+        if not norwegian or not translation:
+            continue
+        row = parse_forms(norwegian)
+        if row is None:
+            continue
+        rows.append({**row, "translations": _parse_translations(translation), "level": level or "A"})
+    return rows
+
+
+async def _import_text(db: AsyncSession, text_data: str, parse_forms, create_bulk, level: str):
+    """Shared text importer: `parse_forms` turns the Norwegian side of a line into column
+    values (or None to skip the line), `create_bulk` inserts the rows. Parsing runs in the
+    threadpool so a big paste does not block the event loop. Returns (added, skipped)."""
+    rows = await run_in_threadpool(_parse_text, text_data, parse_forms, level)
+    added = await create_bulk(db, rows)
+    return added, len(rows) - added
+
+
+def _cell(record: list, i):
+    """Stripped CSV cell at index i, or None when the column or the value is missing."""
+    if i is None or i >= len(record):
+        return None
+    return record[i].strip() or None
+
+
+# model field -> CSV header, per kind
+_NOUN_CSV = {"article": "article", "word": "word", "translations": "translations",
+             "definite": "definite", "plural": "plural"}
+_VERB_CSV = {"infinitive": "infinitive", "presens": "presens", "preteritum": "preteritum",
+             "perfect_participle": "perfect", "translations": "translations",
+             "group": "group", "group_description": "group_description"}
+_ADJECTIVE_CSV = {"base": "base", "neuter": "neuter", "plural": "plural", "translations": "translations",
+                  "group": "group", "group_description": "group_description"}
+_PHRASE_CSV = {"norwegian": "norwegian", "translations": "translations",
+               "category": "category", "notes": "notes"}
+
+
+def _parse_csv(fileobj, columns: dict, required: tuple, level: str) -> list:
+    reader = csv.reader(io.TextIOWrapper(fileobj, encoding="utf-8-sig", newline=""))
+    index = {h.strip(): i for i, h in enumerate(next(reader, []))}
+    fields = [(field, index.get(header)) for field, header in columns.items()]
+    rows = []
+    for record in reader:
+        row = {field: _cell(record, i) for field, i in fields}
+        if any(row[f] is None for f in required):
+            continue
+        row["translations"] = _parse_translations(row["translations"])
+        row["level"] = level or "A"
+        rows.append(row)
+    return rows
+
+
+# background CSV imports: job id -> {"status": "running" | "done" | "failed", ...}
+# In-process only: with several workers, /import-status must hit the worker that ran the import
+_jobs: dict = {}
+
+
+async def _run_import(job_id: str, create_bulk, rows: list):
+    job = _jobs[job_id]
+    try:
+        async with async_session_maker() as db:
+            added = await create_bulk(db, rows)
+        job.update(status="done", added=added, skipped=len(rows) - added)
+    except Exception:
+        logger.exception("CSV import %s failed", job_id)
+        job.update(status="failed", error="Serverfeil, se loggen")
+
+
+async def _import_csv(background_tasks: BackgroundTasks, file: UploadFile, columns: dict,
+                      required: tuple, create_bulk, level: str) -> str:
+    """Shared CSV importer. Reads the upload straight from its spooled temp file with a plain
+    csv.reader and header positions, in the threadpool; rows missing a `required` field are
+    ignored. The insert runs as a background task after the redirect; returns its job id."""
+    rows = await run_in_threadpool(_parse_csv, file.file, columns, required, level)
+    for old_id in [k for k, v in _jobs.items() if v["status"] != "running"][:-50]:
+        del _jobs[old_id]
+    job_id = uuid.uuid4().hex[:12]
+    _jobs[job_id] = {"status": "running", "rows": len(rows)}
+    background_tasks.add_task(_run_import, job_id, create_bulk, rows)
+    return job_id
+
+
+PAGE_SIZE = 100
+
+_pages: dict = {}
+
+
+def _page_args(page: int, size: int) -> tuple:
+    return max(page, 1), min(max(size, 1), 500)
+
+
+async def _cached_page(request: Request, kind: str, template: str, context, key=None):
+    """Serve a rendered list page from memory until the `kind` table is written to.
+    `key` tells apart pages of the same template (e.g. the page number). Requests
+    showing an import banner (?added= / ?job=) are always rendered fresh.
+    Renders are streamed in ~16 KB pieces so a long table starts arriving before it is finished."""
+    banner = "added" in request.query_params or "job" in request.query_params
+    version = None if banner else cache.version(kind)
+    hit = _pages.get((template, key))
+    if version is not None and hit and hit[0] == version:
+        return HTMLResponse(hit[1])
+    chunks = templates.get_template(template).generate({"request": request, **await context()})
+
+    async def stream():
+        body, buf, size = [], [], 0
+        for chunk in chunks:
+            buf.append(chunk)
+            size += len(chunk)
+            if size > 16384:
+                body.append("".join(buf))
+                yield body[-1]
+                buf, size = [], 0
+        body.append("".join(buf))
+        yield body[-1]
+        if version is not None:
+            if len(_pages) >= 256:  # arbitrary ?page= values must not grow this forever
+                _pages.clear()
+            _pages[(template, key)] = (version, "".join(body))
+    return StreamingResponse(stream(), media_type="text/html")
 
 
 # ── INDEX ─────────────────────────────────────────────────────────────────────
 
 @router.get("/", response_class=HTMLResponse)
-async def admin_index(request: Request, db: AsyncSession = Depends(get_db)):
+async def admin_index(request: Request):
+    counts = await crud.count_all()
     return templates.TemplateResponse("admin/index.html", {
         "request": request,
-        "noun_count": await crud.count_nouns(db),
-        "verb_count": await crud.count_verbs(db),
-        "adj_count": await crud.count_adjectives(db),
-        "phrase_count": await crud.count_phrases(db),
-        "qw_count": await crud.count_question_words(db),
+        "noun_count": counts["nouns"],
+        "verb_count": counts["verbs"],
+        "adj_count": counts["adjectives"],
+        "phrase_count": counts["phrases"],
+        "qw_count": counts["question_words"],
     })
 
 
+@router.get("/import-status/{job_id}")
+async def import_status(job_id: str):
+    job = _jobs.get(job_id)
+    if not job:
+        return ORJSONResponse({"error": "Unknown job"}, status_code=404)
+    return ORJSONResponse(job)
+
+
 # ── NOUNS ─────────────────────────────────────────────────────────────────────
 
 @router.get("/nouns", response_class=HTMLResponse)
-async def admin_nouns(request: Request, db: AsyncSession = Depends(get_db)):
-    nouns = await crud.get_nouns(db)
-    return templates.TemplateResponse("admin/nouns.html", {
-        "request": request, "nouns": nouns, "levels": LEVELS
-    })
+async def admin_nouns(request: Request, db: AsyncSession = Depends(get_db),
+                      page: int = 1, size: int = PAGE_SIZE):
+    page, size = _page_args(page, size)
+
+    async def context():
+        return {"nouns": await crud.get_nouns_page(db, page, size), "total": await crud.count_nouns(db),
+                "page": page, "size": size, "levels": LEVELS}
+    return await _cached_page(request, "nouns", "admin/nouns.html", context, (page, size))
 
 
 @router.post("/nouns/add")
@@ -53,59 +241,17 @@ async def add_noun(request: Request, db: AsyncSession = Depends(get_db),
 
 
 @router.post("/nouns/import-csv")
-async def import_nouns_csv(request: Request, db: AsyncSession = Depends(get_db),
-                            file: UploadFile = File(...), level: str = Form("A")):
-    content = await file.read()
-    reader = csv.DictReader(io.StringIO(content.decode("utf-8-sig")))
-    added = skipped = 0
-    for row in reader:
-        article = row.get("article", "").strip()
-        word = row.get("word", "").strip()
-        translations_raw = row.get("translations", "").strip()
-        if not article or not word or not translations_raw:
-            continue
-        result = await crud.create_noun(db, article=article, word=word,
-                                         translations=_parse_translations(translations_raw),
-                                         definite=row.get("definite", "").strip() or None,
-                                         plural=row.get("plural", "").strip() or None,
-                                         level=level or "A")
-        if result:
-            added += 1
-        else:
-            skipped += 1
-    return RedirectResponse(f"/admin/nouns?added={added}&skipped={skipped}", status_code=303)
+async def import_nouns_csv(background_tasks: BackgroundTasks,
+                           file: UploadFile = File(...), level: str = Form("A")):
+    job_id = await _import_csv(background_tasks, file, _NOUN_CSV, ("article", "word", "translations"),
+                               crud.create_nouns_bulk, level)
+    return RedirectResponse(f"/admin/nouns?job={job_id}", status_code=303)
 
 
 @router.post("/nouns/import-text")
 async def import_nouns_text(request: Request, db: AsyncSession = Depends(get_db),
                              text_data: str = Form(...), level: str = Form("A")):
-    added = skipped = 0
-    for line in text_data.strip().splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        sep = "–" if "–" in line else "-"
-        parts = line.split(sep, 1)
-        if len(parts) != 2:
-            continue
-        norwegian = parts[0].strip()
-        translation = parts[1].strip()
-        words = norwegian.split()
-        if len(words) < 2:
-            continue
-        # Normalize article - replace lookalike cyrillic chars with latin
-        article = words[0].lower()
-        article = article.replace("е", "e").replace("і", "i")  # cyrillic lookalikes
-        word = " ".join(words[1:])
-        if article not in ["en", "ei", "et"]:
-            continue
-        result = await crud.create_noun(db, article=article, word=word,
-                                         translations=_parse_translations(translation),
-                                         level=level or "A")
-        if result:
-            added += 1
-        else:
-            skipped += 1
+    added, skipped = await _import_text(db, text_data, _noun_forms, crud.create_nouns_bulk, level)
     return RedirectResponse(f"/admin/nouns?added={added}&skipped={skipped}", status_code=303)
 
 
@@ -137,11 +283,14 @@ async def delete_noun(noun_id: int, db: AsyncSession = Depends(get_db)):
 # ── VERBS ─────────────────────────────────────────────────────────────────────
 
 @router.get("/verbs", response_class=HTMLResponse)
-async def admin_verbs(request: Request, db: AsyncSession = Depends(get_db)):
-    verbs = await crud.get_verbs(db)
-    return templates.TemplateResponse("admin/verbs.html", {
-        "request": request, "verbs": verbs, "levels": LEVELS
-    })
+async def admin_verbs(request: Request, db: AsyncSession = Depends(get_db),
+                      page: int = 1, size: int = PAGE_SIZE):
+    page, size = _page_args(page, size)
+
+    async def context():
+        return {"verbs": await crud.get_verbs_page(db, page, size), "total": await crud.count_verbs(db),
+                "page": page, "size": size, "levels": LEVELS}
+    return await _cached_page(request, "verbs", "admin/verbs.html", context, (page, size))
 
 
 @router.post("/verbs/add")
@@ -163,61 +312,16 @@ async def add_verb(request: Request, db: AsyncSession = Depends(get_db),
 async def import_verbs_text(request: Request, db: AsyncSession = Depends(get_db),
                              text_data: str = Form(...), level: str = Form("A")):
     """Format: å gå – ходя  OR  å gå | går | gikk | gått – ходя"""
-    added = skipped = 0
-    for line in text_data.strip().splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        sep = "–" if "–" in line else "-"
-        parts = line.split(sep, 1)
-        if len(parts) != 2:
-            continue
-        norwegian = parts[0].strip()
-        translation = parts[1].strip()
-        if not norwegian or not translation:
-            continue
-        # Parse optional conjugations: å gå | går | gikk | gått
-        conj_parts = [p.strip() for p in norwegian.split("|")]
-        infinitive = conj_parts[0]
-        presens = conj_parts[1] if len(conj_parts) > 1 else None
-        preteritum = conj_parts[2] if len(conj_parts) > 2 else None
-        perfect = conj_parts[3] if len(conj_parts) > 3 else None
-        result = await crud.create_verb(db, infinitive=infinitive, presens=presens,
-                                         preteritum=preteritum, perfect_participle=perfect,
-                                         translations=_parse_translations(translation),
-                                         level=level or "A")
-        if result:
-            added += 1
-        else:
-            skipped += 1
+    added, skipped = await _import_text(db, text_data, _verb_forms, crud.create_verbs_bulk, level)
     return RedirectResponse(f"/admin/verbs?added={added}&skipped={skipped}", status_code=303)
 
 
 @router.post("/verbs/import-csv")
-async def import_verbs_csv(request: Request, db: AsyncSession = Depends(get_db),
-                            file: UploadFile = File(...), level: str = Form("A")):
-    content = await file.read()
-    reader = csv.DictReader(io.StringIO(content.decode("utf-8-sig")))
-    added = skipped = 0
-    for row in reader:
-        infinitive = row.get("infinitive", "").strip()
-        translations_raw = row.get("translations", "").strip()
-        if not infinitive or not translations_raw:
-            continue
-        result = await crud.create_verb(db,
-            infinitive=infinitive,
-            presens=row.get("presens", "").strip() or None,
-            preteritum=row.get("preteritum", "").strip() or None,
-            perfect_participle=row.get("perfect", "").strip() or None,
-            translations=_parse_translations(translations_raw),
-            group=row.get("group", "").strip() or None,
-            group_description=row.get("group_description", "").strip() or None,
-            level=level or "A")
-        if result:
-            added += 1
-        else:
-            skipped += 1
-    return RedirectResponse(f"/admin/verbs?added={added}&skipped={skipped}", status_code=303)
+async def import_verbs_csv(background_tasks: BackgroundTasks,
+                           file: UploadFile = File(...), level: str = Form("A")):
+    job_id = await _import_csv(background_tasks, file, _VERB_CSV, ("infinitive", "translations"),
+                               crud.create_verbs_bulk, level)
+    return RedirectResponse(f"/admin/verbs?job={job_id}", status_code=303)
 
 
 @router.get("/verbs/edit/{verb_id}", response_class=HTMLResponse)
@@ -251,11 +355,14 @@ async def delete_verb(verb_id: int, db: AsyncSession = Depends(get_db)):
 # ── ADJECTIVES ────────────────────────────────────────────────────────────────
 
 @router.get("/adjectives", response_class=HTMLResponse)
-async def admin_adjectives(request: Request, db: AsyncSession = Depends(get_db)):
-    adjs = await crud.get_adjectives(db)
-    return templates.TemplateResponse("admin/adjectives.html", {
-        "request": request, "adjectives": adjs, "levels": LEVELS
-    })
+async def admin_adjectives(request: Request, db: AsyncSession = Depends(get_db),
+                           page: int = 1, size: int = PAGE_SIZE):
+    page, size = _page_args(page, size)
+
+    async def context():
+        return {"adjectives": await crud.get_adjectives_page(db, page, size), "total": await crud.count_adjectives(db),
+                "page": page, "size": size, "levels": LEVELS}
+    return await _cached_page(request, "adjectives", "admin/adjectives.html", context, (page, size))
 
 
 @router.post("/adjectives/add")
@@ -276,57 +383,16 @@ async def add_adjective(request: Request, db: AsyncSession = Depends(get_db),
 async def import_adjectives_text(request: Request, db: AsyncSession = Depends(get_db),
                                   text_data: str = Form(...), level: str = Form("A")):
     """Format: stor – голям  OR  stor | stort | store – голям"""
-    added = skipped = 0
-    for line in text_data.strip().splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        sep = "–" if "–" in line else "-"
-        parts = line.split(sep, 1)
-        if len(parts) != 2:
-            continue
-        norwegian = parts[0].strip()
-        translation = parts[1].strip()
-        if not norwegian or not translation:
-            continue
-        conj_parts = [p.strip() for p in norwegian.split("|")]
-        base = conj_parts[0]
-        neuter = conj_parts[1] if len(conj_parts) > 1 else None
-        plural = conj_parts[2] if len(conj_parts) > 2 else None
-        result = await crud.create_adjective(db, base=base, neuter=neuter, plural=plural,
-                                              translations=_parse_translations(translation),
-                                              level=level or "A")
-        if result:
-            added += 1
-        else:
-            skipped += 1
+    added, skipped = await _import_text(db, text_data, _adjective_forms, crud.create_adjectives_bulk, level)
     return RedirectResponse(f"/admin/adjectives?added={added}&skipped={skipped}", status_code=303)
 
 
 @router.post("/adjectives/import-csv")
-async def import_adjectives_csv(request: Request, db: AsyncSession = Depends(get_db),
-                                 file: UploadFile = File(...), level: str = Form("A")):
-    content = await file.read()
-    reader = csv.DictReader(io.StringIO(content.decode("utf-8-sig")))
-    added = skipped = 0
-    for row in reader:
-        base = row.get("base", "").strip()
-        translations_raw = row.get("translations", "").strip()
-        if not base or not translations_raw:
-            continue
-        result = await crud.create_adjective(db,
-            base=base,
-            neuter=row.get("neuter", "").strip() or None,
-            plural=row.get("plural", "").strip() or None,
-            translations=_parse_translations(translations_raw),
-            group=row.get("group", "").strip() or None,
-            group_description=row.get("group_description", "").strip() or None,
-            level=level or "A")
-        if result:
-            added += 1
-        else:
-            skipped += 1
-    return RedirectResponse(f"/admin/adjectives?added={added}&skipped={skipped}", status_code=303)
+async def import_adjectives_csv(background_tasks: BackgroundTasks,
+                                file: UploadFile = File(...), level: str = Form("A")):
+    job_id = await _import_csv(background_tasks, file, _ADJECTIVE_CSV, ("base", "translations"),
+                               crud.create_adjectives_bulk, level)
+    return RedirectResponse(f"/admin/adjectives?job={job_id}", status_code=303)
 
 
 @router.get("/adjectives/edit/{adj_id}", response_class=HTMLResponse)
@@ -360,11 +426,14 @@ async def delete_adjective(adj_id: int, db: AsyncSession = Depends(get_db)):
 # ── PHRASES ───────────────────────────────────────────────────────────────────
 
 @router.get("/phrases", response_class=HTMLResponse)
-async def admin_phrases(request: Request, db: AsyncSession = Depends(get_db)):
-    phrases = await crud.get_phrases(db)
-    return templates.TemplateResponse("admin/phrases.html", {
-        "request": request, "phrases": phrases, "levels": LEVELS
-    })
+async def admin_phrases(request: Request, db: AsyncSession = Depends(get_db),
+                        page: int = 1, size: int = PAGE_SIZE):
+    page, size = _page_args(page, size)
+
+    async def context():
+        return {"phrases": await crud.get_phrases_page(db, page, size), "total": await crud.count_phrases(db),
+                "page": page, "size": size, "levels": LEVELS}
+    return await _cached_page(request, "phrases", "admin/phrases.html", context, (page, size))
 
 
 @router.post("/phrases/add")
@@ -381,50 +450,16 @@ async def add_phrase(request: Request, db: AsyncSession = Depends(get_db),
 @router.post("/phrases/import-text")
 async def import_phrases_text(request: Request, db: AsyncSession = Depends(get_db),
                                text_data: str = Form(...), level: str = Form("A")):
-    added = skipped = 0
-    for line in text_data.strip().splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        sep = "–" if "–" in line else "-"
-        parts = line.split(sep, 1)
-        if len(parts) != 2:
-            continue
-        norwegian = parts[0].strip()
-        translation = parts[1].strip()
-        if not norwegian or not translation:
-            continue
-        result = await crud.create_phrase(db, norwegian=norwegian,
-                                           translations=_parse_translations(translation),
-                                           level=level or "A")
-        if result:
-            added += 1
-        else:
-            skipped += 1
+    added, skipped = await _import_text(db, text_data, _phrase_forms, crud.create_phrases_bulk, level)
     return RedirectResponse(f"/admin/phrases?added={added}&skipped={skipped}", status_code=303)
 
 
 @router.post("/phrases/import-csv")
-async def import_phrases_csv(request: Request, db: AsyncSession = Depends(get_db),
-                              file: UploadFile = File(...), level: str = Form("A")):
-    content = await file.read()
-    reader = csv.DictReader(io.StringIO(content.decode("utf-8-sig")))
-    added = skipped = 0
-    for row in reader:
-        norwegian = row.get("norwegian", "").strip()
-        translations_raw = row.get("translations", "").strip()
-        if not norwegian or not translations_raw:
-            continue
-        result = await crud.create_phrase(db, norwegian=norwegian,
-                                           translations=_parse_translations(translations_raw),
-                                           category=row.get("category", "").strip() or None,
-                                           notes=row.get("notes", "").strip() or None,
-                                           level=level or "A")
-        if result:
-            added += 1
-        else:
-            skipped += 1
-    return RedirectResponse(f"/admin/phrases?added={added}&skipped={skipped}", status_code=303)
+async def import_phrases_csv(background_tasks: BackgroundTasks,
+                             file: UploadFile = File(...), level: str = Form("A")):
+    job_id = await _import_csv(background_tasks, file, _PHRASE_CSV, ("norwegian", "translations"),
+                               crud.create_phrases_bulk, level)
+    return RedirectResponse(f"/admin/phrases?job={job_id}", status_code=303)
 
 
 @router.get("/phrases/edit/{phrase_id}", response_class=HTMLResponse)
@@ -456,10 +491,9 @@ async def delete_phrase(phrase_id: int, db: AsyncSession = Depends(get_db)):
 
 @router.get("/question-words", response_class=HTMLResponse)
 async def admin_question_words(request: Request, db: AsyncSession = Depends(get_db)):
-    qwords = await crud.get_question_words(db)
-    return templates.TemplateResponse("admin/question_words.html", {
-        "request": request, "question_words": qwords
-    })
+    async def context():
+        return {"question_words": await crud.get_question_words(db)}
+    return await _cached_page(request, "question_words", "admin/question_words.html", context)
 
 
 @router.post("/question-words/add")
@@ -479,24 +513,25 @@ async def add_question_word(request: Request, db: AsyncSession = Depends(get_db)
 async def import_question_words_text(request: Request, db: AsyncSession = Depends(get_db),
                                       text_data: str = Form(...)):
     added = skipped = 0
-    for line in text_data.strip().splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        sep = "–" if "–" in line else "-"
-        parts = line.split(sep, 1)
-        if len(parts) != 2:
-            continue
-        norwegian = parts[0].strip()
-        translation = parts[1].strip()
-        if not norwegian or not translation:
-            continue
-        result = await crud.create_question_word(db, norwegian=norwegian,
-                                                  translations=_parse_translations(translation))
-        if result:
-            added += 1
-        else:
-            skipped += 1
+    seen = set()
+    async with crud.unit_of_work(db):
+        for line in text_data.splitlines():
+            parsed = _split_line(line)
+            if not parsed:
+                continue
+            norwegian, translation = parsed
+            if not norwegian or not translation:
+                continue
+            if norwegian in seen:  # repeated in this paste; no need to ask the DB
+                skipped += 1
+                continue
+            seen.add(norwegian)
+            result = await crud.create_question_word(db, norwegian=norwegian,
+                                                      translations=_parse_translations(translation), commit=False)
+            if result:
+                added += 1
+            else:
+                skipped += 1
     return RedirectResponse(f"/admin/question-words?added={added}&skipped={skipped}", status_code=303)
 
 
@@ -586,7 +621,7 @@ async def admin_cat_entries(cat_id: int, request: Request, db: AsyncSession = De
 async def add_cat_entry(cat_id: int, db: AsyncSession = Depends(get_db),
                          norwegian: str = Form(...), translations: str = Form(...),
                          level: str = Form("A")):
-    trans = [t.strip() for t in translations.replace("|", ",").split(",") if t.strip()]
+    trans = _parse_translations(translations)
     entry = CustomEntry(category_id=cat_id, norwegian=norwegian,
                         translations=trans, level=level)
     db.add(entry)
@@ -607,10 +642,9 @@ async def delete_cat_entry(cat_id: int, entry_id: int, db: AsyncSession = Depend
 async def nouns_missing_forms(db: AsyncSession = Depends(get_db)):
     from sqlalchemy import or_
     result = await db.execute(
-        select(Noun).where(or_(Noun.definite == None, Noun.plural == None))
+        select(Noun.id, Noun.word).where(or_(Noun.definite == None, Noun.plural == None))
     )
-    nouns = result.scalars().all()
-    return JSONResponse({"nouns": [{"id": n.id, "word": n.word} for n in nouns]})
+    return ORJSONResponse({"nouns": [{"id": n.id, "word": n.word} for n in result]})
 
 
 @router.post("/nouns/update-forms/{noun_id}")
@@ -623,4 +657,5 @@ async def update_noun_forms(noun_id: int, request: Request, db: AsyncSession = D
         if data.get("plural") and not noun.plural:
             noun.plural = data["plural"]
         await db.commit()
-    return JSONResponse({"ok": True})
+        cache.invalidate("nouns")
+    return ORJSONResponse({"ok": True})
@@ -1,14 +1,13 @@
 """app/routers/custom_categories.py  —  add to main.py: app.include_router(custom_categories.router)"""
 import json, re
 from fastapi import APIRouter, Depends, Request, Form, UploadFile, File
-from fastapi.responses import HTMLResponse, RedirectResponse, JSONResponse
-from fastapi.templating import Jinja2Templates
+from fastapi.responses import HTMLResponse, RedirectResponse, ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, delete, func, text
 from app.db import get_db
+from app.templating import templates
 
 router = APIRouter()
-templates = Jinja2Templates(directory="app/templates")
 
 LEVELS = ["A", "B1.1", "B1.2", "B2.1", "B2.2"]
 
@@ -17,8 +16,10 @@ LEVELS = ["A", "B1.1", "B1.2", "B2.1", "B2.2"]
 def _slugify(name: str) -> str:
     return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
 
+_TRANS_SPLIT = re.compile(r"\s*[;,]\s*")
+
 def _parse_translations(raw: str) -> list:
-    return [t.strip() for t in raw.replace(";", ",").split(",") if t.strip()]
+    return [t for t in _TRANS_SPLIT.split(raw.strip()) if t]
 
 def _normalize(s: str) -> str:
     return s.lower().rstrip(".!?,;:")
@@ -129,7 +130,10 @@ async def import_custom_text(slug: str, db: AsyncSession = Depends(get_db),
     if not cat:
         return RedirectResponse("/admin/custom-categories", status_code=303)
     added = skipped = 0
-    for line in text_data.strip().splitlines():
+    # duplicate check against one set instead of a SELECT per line
+    existing = await db.execute(select(CustomEntry.norwegian).where(CustomEntry.category_id == cat.id))
+    seen = set(existing.scalars())
+    for line in text_data.splitlines():
         line = line.strip()
         if not line:
             continue
@@ -141,13 +145,10 @@ async def import_custom_text(slug: str, db: AsyncSession = Depends(get_db),
         translation = parts[1].strip()
         if not norwegian or not translation:
             continue
-        existing = await db.execute(
-            select(CustomEntry).where(
-                CustomEntry.category_id == cat.id,
-                CustomEntry.norwegian == norwegian))
-        if existing.scalar_one_or_none():
+        if norwegian in seen:
             skipped += 1
             continue
+        seen.add(norwegian)
         db.add(CustomEntry(category_id=cat.id, norwegian=norwegian,
                            translations=_parse_translations(translation), level=level or "A"))
         added += 1
@@ -184,7 +185,7 @@ async def next_custom_entry(slug: str, request: Request, db: AsyncSession = Depe
     from app.db import CustomEntry
     cat = await _get_cat(db, slug)
     if not cat:
-        return JSONResponse({"done": True})
+        return ORJSONResponse({"done": True})
     data = await request.json()
     seen = data.get("seen_ids", [])
     level = data.get("level", "all")
@@ -199,8 +200,8 @@ async def next_custom_entry(slug: str, request: Request, db: AsyncSession = Depe
     result = await db.execute(q)
     entry = result.scalar_one_or_none()
     if not entry:
-        return JSONResponse({"done": True})
-    return JSONResponse({
+        return ORJSONResponse({"done": True})
+    return ORJSONResponse({
         "id": entry.id,
         "norwegian": entry.norwegian,
         "translations": entry.translations,
@@ -220,7 +221,7 @@ async def check_custom_entry(slug: str, request: Request, db: AsyncSession = Dep
     result = await db.execute(select(CustomEntry).where(CustomEntry.id == entry_id))
     entry = result.scalar_one_or_none()
     if not entry:
-        return JSONResponse({"correct": False})
+        return ORJSONResponse({"correct": False})
 
     ua = _normalize(answer)
     if reverse:
@@ -228,7 +229,7 @@ async def check_custom_entry(slug: str, request: Request, db: AsyncSession = Dep
     else:
         correct = any(ua == _normalize(t) for part in entry.translations for t in part.split(","))
 
-    return JSONResponse({
+    return ORJSONResponse({
         "correct": correct,
         "norwegian": entry.norwegian,
         "translations": entry.translations,
@@ -1,66 +1,106 @@
 """Practice router - v3.0"""
 from fastapi import APIRouter, Request, Depends, Form
-from fastapi.responses import HTMLResponse, JSONResponse
-from fastapi.templating import Jinja2Templates
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.db import get_db, LEVELS, CustomCategory, CustomEntry
+from app.db import get_db, LEVELS
 from sqlalchemy import select
 import app.crud as crud
+from app.templating import templates
+from app import settings
+import hashlib
+import secrets
+import time
 
 router = APIRouter()
-templates = Jinja2Templates(directory="app/templates")
+
+# Rendered practice pages and their ETags, keyed by (template, level): nothing else varies between requests
+_pages: dict = {}
+_PAGE_CACHE_CONTROL = "public, max-age=60"
+
+
+def _static_page(request: Request, template: str, level: str = None) -> Response:
+    page = _pages.get((template, level))
+    if page is None:
+        context = {"request": request}
+        if level is not None:
+            context.update(selected_level=level, levels=LEVELS)
+        html = templates.get_template(template).render(context)
+        page = (html, '"%s"' % hashlib.blake2b(html.encode(), digest_size=8).hexdigest())
+        if not settings.TEMPLATES_AUTO_RELOAD:
+            if len(_pages) >= 256:  # arbitrary ?level= values must not grow this forever
+                _pages.clear()
+            _pages[(template, level)] = page
+    html, etag = page
+    headers = {"ETag": etag, "Cache-Control": _PAGE_CACHE_CONTROL}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return HTMLResponse(html, headers=headers)
+
+
+# Practice sessions: token -> [last used, ids already served]. Pages send the short token
+# instead of their whole seen list on every click.
+_sessions: dict = {}
+_SESSION_IDLE = 3600
+_MAX_SESSIONS = 1000
+
+
+def _session(data: dict) -> tuple:
+    """(token, seen ids, expired) for a /next body. A missing or expired token starts a new
+    session seeded from `seen_ids`, so clients that still send the list keep working;
+    `expired` tells a client whose token was dropped that its progress starts over."""
+    now = time.monotonic()
+    token = data.get("session")
+    entry = _sessions.get(token) if token else None
+    expired = bool(token) and entry is None
+    if entry is None:
+        for stale in [t for t, e in _sessions.items() if now - e[0] > _SESSION_IDLE]:
+            del _sessions[stale]
+        if len(_sessions) >= _MAX_SESSIONS:
+            del _sessions[min(_sessions, key=lambda t: _sessions[t][0])]
+        token = secrets.token_urlsafe(8)
+        entry = _sessions[token] = [now, set(data.get("seen_ids") or [])]
+    entry[0] = now
+    return token, entry[1], expired
 
 
 # ── HOME ─────────────────────────────────────────────────────────────────────
 
 @router.get("/", response_class=HTMLResponse)
 async def home(request: Request, db: AsyncSession = Depends(get_db)):
-    noun_count = await crud.count_nouns(db)
+    counts = await crud.count_all()
     # Custom categories with entry counts
     from app.db import CustomCategory, CustomEntry
     from sqlalchemy import func as sqlfunc
-    cats_result = await db.execute(select(CustomCategory).order_by(CustomCategory.name))
-    raw_cats = cats_result.scalars().all()
+    # one grouped query instead of a COUNT per category
+    cats_result = await db.execute(
+        select(CustomCategory, sqlfunc.count(CustomEntry.id))
+        .outerjoin(CustomEntry, CustomEntry.category_id == CustomCategory.id)
+        .group_by(CustomCategory.id).order_by(CustomCategory.name))
     custom_cats = []
-    for cat in raw_cats:
-        r = await db.execute(select(sqlfunc.count(CustomEntry.id)).where(CustomEntry.category_id == cat.id))
-        cat.entry_count = r.scalar() or 0
+    for cat, entry_count in cats_result:
+        cat.entry_count = entry_count
         custom_cats.append(cat)
-    verb_count = await crud.count_verbs(db)
-    adj_count = await crud.count_adjectives(db)
-    phrase_count = await crud.count_phrases(db)
-    qw_count = await crud.count_question_words(db)
     return templates.TemplateResponse("home.html", {
         "request": request,
-        "noun_count": noun_count,
+        "noun_count": counts["nouns"],
         "custom_cats": custom_cats,
-        "verb_count": verb_count,
-        "adj_count": adj_count,
-        "phrase_count": phrase_count,
-        "qw_count": qw_count,
+        "verb_count": counts["verbs"],
+        "adj_count": counts["adjectives"],
+        "phrase_count": counts["phrases"],
+        "qw_count": counts["question_words"],
         "levels": LEVELS,
     })
 
 
 # ── NOUNS ─────────────────────────────────────────────────────────────────────
 
-@router.get("/practice/nouns", response_class=HTMLResponse)
+@router.api_route("/practice/nouns", methods=["GET", "HEAD"], response_class=HTMLResponse)
 async def practice_nouns(request: Request, level: str = "all"):
-    return templates.TemplateResponse("practice/nouns.html", {
-        "request": request, "selected_level": level, "levels": LEVELS
-    })
+    return _static_page(request, "practice/nouns.html", level)
 
 
-@router.post("/practice/nouns/next")
-async def next_noun(request: Request, db: AsyncSession = Depends(get_db)):
-    data = await request.json()
-    exclude = data.get("seen_ids", [])
-    level = data.get("level", "all")
-    noun = await crud.get_random_noun(db, exclude, level)
-    if not noun:
-        return JSONResponse({"done": True})
-    return JSONResponse({
-        "done": False,
+def _noun_item(noun) -> dict:
+    return {
         "id": noun.id,
         "article": noun.article,
         "word": noun.word,
@@ -68,7 +108,34 @@ async def next_noun(request: Request, db: AsyncSession = Depends(get_db)):
         "plural": noun.plural,
         "translations": noun.translations,
         "level": noun.level,
-    })
+    }
+
+
+@router.post("/practice/nouns/next")
+async def next_noun(request: Request, db: AsyncSession = Depends(get_db)):
+    data = await request.json()
+    token, seen, expired = _session(data)
+    level = data.get("level", "all")
+    noun = await crud.get_random_noun(db, seen, level)
+    if not noun:
+        return ORJSONResponse({"done": True, "session": token, "session_expired": expired})
+    seen.add(noun.id)
+    return ORJSONResponse({"done": False, "session": token, "session_expired": expired, **_noun_item(noun)})
+
+
+@router.post("/practice/nouns/batch")
+async def next_nouns_batch(request: Request, db: AsyncSession = Depends(get_db)):
+    """Like /next, but up to `n` unseen nouns at once; the page works through them locally."""
+    data = await request.json()
+    try:
+        n = max(1, min(int(data.get("n", 20)), 100))
+    except (TypeError, ValueError):
+        n = 20
+    token, seen, expired = _session(data)
+    nouns = await crud.get_random_nouns_batch(db, seen, data.get("level", "all"), n)
+    seen.update(noun.id for noun in nouns)
+    return ORJSONResponse({"done": not nouns, "session": token, "session_expired": expired,
+                           "items": [_noun_item(noun) for noun in nouns]})
 
 
 @router.post("/practice/nouns/check")
@@ -76,9 +143,9 @@ async def check_noun(request: Request, db: AsyncSession = Depends(get_db)):
     data = await request.json()
     noun = await crud.get_noun(db, data["id"])
     if not noun:
-        return JSONResponse({"error": True})
+        return ORJSONResponse({"error": True})
     correct = await crud.check_noun_answer(noun, data.get("answer", ""))
-    return JSONResponse({
+    return ORJSONResponse({
         "correct": correct,
         "article": noun.article,
         "word": noun.word,
@@ -89,28 +156,29 @@ async def check_noun(request: Request, db: AsyncSession = Depends(get_db)):
 
 # ── VERBS ─────────────────────────────────────────────────────────────────────
 
-@router.get("/practice/verbs", response_class=HTMLResponse)
+@router.api_route("/practice/verbs", methods=["GET", "HEAD"], response_class=HTMLResponse)
 async def practice_verbs(request: Request, level: str = "all"):
-    return templates.TemplateResponse("practice/verbs.html", {
-        "request": request, "selected_level": level, "levels": LEVELS
-    })
+    return _static_page(request, "practice/verbs.html", level)
 
 # ── NUMBERS ─────────────────────────────────────────────────────────────────────
 
-@router.get("/practice/numbers", response_class=HTMLResponse)
+@router.api_route("/practice/numbers", methods=["GET", "HEAD"], response_class=HTMLResponse)
 async def practice_numbers(request: Request):
-    return templates.TemplateResponse("practice/numbers.html", {"request": request})
+    return _static_page(request, "practice/numbers.html")
 
 @router.post("/practice/verbs/next")
 async def next_verb(request: Request, db: AsyncSession = Depends(get_db)):
     data = await request.json()
-    exclude = data.get("seen_ids", [])
+    token, seen, expired = _session(data)
     level = data.get("level", "all")
-    verb = await crud.get_random_verb(db, exclude, level)
+    verb = await crud.get_random_verb(db, seen, level)
     if not verb:
-        return JSONResponse({"done": True})
-    return JSONResponse({
+        return ORJSONResponse({"done": True, "session": token, "session_expired": expired})
+    seen.add(verb.id)
+    return ORJSONResponse({
         "done": False,
+        "session": token,
+        "session_expired": expired,
         "id": verb.id,
         "infinitive": verb.infinitive,
         "presens": verb.presens,
@@ -128,11 +196,11 @@ async def check_verb(request: Request, db: AsyncSession = Depends(get_db)):
     data = await request.json()
     verb = await crud.get_verb(db, data["id"])
     if not verb:
-        return JSONResponse({"error": True})
+        return ORJSONResponse({"error": True})
     result = await crud.check_verb_answer(
         verb, data.get("presens", ""), data.get("preteritum", ""), data.get("perfect", "")
     )
-    return JSONResponse({
+    return ORJSONResponse({
         **result,
         "infinitive": verb.infinitive,
         "presens": verb.presens,
@@ -147,23 +215,24 @@ async def check_verb(request: Request, db: AsyncSession = Depends(get_db)):
 
 # ── ADJECTIVES ────────────────────────────────────────────────────────────────
 
-@router.get("/practice/adjectives", response_class=HTMLResponse)
+@router.api_route("/practice/adjectives", methods=["GET", "HEAD"], response_class=HTMLResponse)
 async def practice_adjectives(request: Request, level: str = "all"):
-    return templates.TemplateResponse("practice/adjectives.html", {
-        "request": request, "selected_level": level, "levels": LEVELS
-    })
+    return _static_page(request, "practice/adjectives.html", level)
 
 
 @router.post("/practice/adjectives/next")
 async def next_adjective(request: Request, db: AsyncSession = Depends(get_db)):
     data = await request.json()
-    exclude = data.get("seen_ids", [])
+    token, seen, expired = _session(data)
     level = data.get("level", "all")
-    adj = await crud.get_random_adjective(db, exclude, level)
+    adj = await crud.get_random_adjective(db, seen, level)
     if not adj:
-        return JSONResponse({"done": True})
-    return JSONResponse({
+        return ORJSONResponse({"done": True, "session": token, "session_expired": expired})
+    seen.add(adj.id)
+    return ORJSONResponse({
         "done": False,
+        "session": token,
+        "session_expired": expired,
         "id": adj.id,
         "base": adj.base,
         "neuter": adj.neuter,
@@ -180,11 +249,11 @@ async def check_adjective(request: Request, db: AsyncSession = Depends(get_db)):
     data = await request.json()
     adj = await crud.get_adjective(db, data["id"])
     if not adj:
-        return JSONResponse({"error": True})
+        return ORJSONResponse({"error": True})
     result = await crud.check_adjective_answer(
         adj, data.get("neuter", ""), data.get("plural", ""), data.get("translation", "")
     )
-    return JSONResponse({
+    return ORJSONResponse({
         **result,
         "base": adj.base,
         "neuter": adj.neuter,
@@ -198,23 +267,24 @@ async def check_adjective(request: Request, db: AsyncSession = Depends(get_db)):
 
 # ── PHRASES ───────────────────────────────────────────────────────────────────
 
-@router.get("/practice/phrases", response_class=HTMLResponse)
+@router.api_route("/practice/phrases", methods=["GET", "HEAD"], response_class=HTMLResponse)
 async def practice_phrases(request: Request, level: str = "all"):
-    return templates.TemplateResponse("practice/phrases.html", {
-        "request": request, "selected_level": level, "levels": LEVELS
-    })
+    return _static_page(request, "practice/phrases.html", level)
 
 
 @router.post("/practice/phrases/next")
 async def next_phrase(request: Request, db: AsyncSession = Depends(get_db)):
     data = await request.json()
-    exclude = data.get("seen_ids", [])
+    token, seen, expired = _session(data)
     level = data.get("level", "all")
-    phrase = await crud.get_random_phrase(db, exclude, level)
+    phrase = await crud.get_random_phrase(db, seen, level)
     if not phrase:
-        return JSONResponse({"done": True})
-    return JSONResponse({
+        return ORJSONResponse({"done": True, "session": token, "session_expired": expired})
+    seen.add(phrase.id)
+    return ORJSONResponse({
         "done": False,
+        "session": token,
+        "session_expired": expired,
         "id": phrase.id,
         "norwegian": phrase.norwegian,
         "translations": phrase.translations,
@@ -227,9 +297,9 @@ async def check_phrase(request: Request, db: AsyncSession = Depends(get_db)):
     data = await request.json()
     phrase = await crud.get_phrase(db, data["id"])
     if not phrase:
-        return JSONResponse({"error": True})
+        return ORJSONResponse({"error": True})
     correct = await crud.check_phrase_answer(phrase, data.get("answer", ""))
-    return JSONResponse({
+    return ORJSONResponse({
         "correct": correct,
         "norwegian": phrase.norwegian,
         "translations": phrase.translations,
@@ -239,20 +309,23 @@ async def check_phrase(request: Request, db: AsyncSession = Depends(get_db)):
 
 # ── QUESTION WORDS ────────────────────────────────────────────────────────────
 
-@router.get("/practice/question-words", response_class=HTMLResponse)
+@router.api_route("/practice/question-words", methods=["GET", "HEAD"], response_class=HTMLResponse)
 async def practice_question_words(request: Request):
-    return templates.TemplateResponse("practice/question_words.html", {"request": request})
+    return _static_page(request, "practice/question_words.html")
 
 
 @router.post("/practice/question-words/next")
 async def next_question_word(request: Request, db: AsyncSession = Depends(get_db)):
     data = await request.json()
-    exclude = data.get("seen_ids", [])
-    qw = await crud.get_random_question_word(db, exclude)
+    token, seen, expired = _session(data)
+    qw = await crud.get_random_question_word(db, seen)
     if not qw:
-        return JSONResponse({"done": True})
-    return JSONResponse({
+        return ORJSONResponse({"done": True, "session": token, "session_expired": expired})
+    seen.add(qw.id)
+    return ORJSONResponse({
         "done": False,
+        "session": token,
+        "session_expired": expired,
         "id": qw.id,
         "norwegian": qw.norwegian,
         "translations": qw.translations,
@@ -267,13 +340,13 @@ async def check_question_word(request: Request, db: AsyncSession = Depends(get_d
     data = await request.json()
     qw = await crud.get_question_word(db, data["id"])
     if not qw:
-        return JSONResponse({"error": True})
+        return ORJSONResponse({"error": True})
     reverse = data.get("reverse", False)
     if reverse:
         correct = crud._normalize(data.get("answer", "")) == crud._normalize(qw.norwegian or "")
     else:
         correct = await crud.check_question_word_answer(qw, data.get("answer", ""))
-    return JSONResponse({
+    return ORJSONResponse({
         "correct": correct,
         "norwegian": qw.norwegian,
         "translations": qw.translations,
@@ -291,65 +364,8 @@ async def search_page(request: Request, q: str = ""):
 
 
 @router.get("/search/results")
-async def search_results(q: str, db: AsyncSession = Depends(get_db)):
+async def search_results(q: str):
     if not q or len(q.strip()) < 2:
-        return JSONResponse({"results": []})
-    results = await crud.search_all(db, q.strip())
-    return JSONResponse({"results": results})
-
-# ── CUSTOM CATEGORIES ─────────────────────────────────────────────────────────
-@router.get("/practice/custom/{cat_slug}", response_class=HTMLResponse)
-async def practice_custom(cat_slug: str, request: Request, db: AsyncSession = Depends(get_db)):
-    from sqlalchemy import select
-    result = await db.execute(select(CustomCategory).where(CustomCategory.slug == cat_slug))
-    cat = result.scalar_one_or_none()
-    if not cat:
-        return RedirectResponse("/", status_code=303)
-    return templates.TemplateResponse("practice/custom.html", {
-        "request": request, "cat": cat, "levels": LEVELS
-    })
-
-@router.post("/practice/custom/{cat_slug}/next")
-async def next_custom(cat_slug: str, request: Request, db: AsyncSession = Depends(get_db)):
-    from sqlalchemy import select
-    data = await request.json()
-    exclude = data.get("seen_ids", [])
-    level = data.get("level", "all")
-    cat_r = await db.execute(select(CustomCategory).where(CustomCategory.slug == cat_slug))
-    cat = cat_r.scalar_one_or_none()
-    if not cat:
-        return JSONResponse({"done": True})
-    q = select(CustomEntry).where(CustomEntry.category_id == cat.id)
-    if level != "all":
-        q = q.where(CustomEntry.level == level)
-    if exclude:
-        q = q.where(CustomEntry.id.notin_(exclude))
-    from sqlalchemy import func
-    q = q.order_by(func.random()).limit(1)
-    result = await db.execute(q)
-    entry = result.scalar_one_or_none()
-    if not entry:
-        return JSONResponse({"done": True})
-    return JSONResponse({
-        "done": False,
-        "id": entry.id,
-        "norwegian": entry.norwegian,
-        "translations": entry.translations,
-        "level": entry.level,
-    })
-
-@router.post("/practice/custom/{cat_slug}/check")
-async def check_custom(cat_slug: str, request: Request, db: AsyncSession = Depends(get_db)):
-    from sqlalchemy import select
-    data = await request.json()
-    result = await db.execute(select(CustomEntry).where(CustomEntry.id == data["id"]))
-    entry = result.scalar_one_or_none()
-    if not entry:
-        return JSONResponse({"error": True})
-    answer = crud._normalize(data.get("answer", ""))
-    correct = any(answer == crud._normalize(t) for t in (entry.translations or []))
-    return JSONResponse({
-        "correct": correct,
-        "norwegian": entry.norwegian,
-        "translations": entry.translations,
-    })
+        return ORJSONResponse({"results": []})
+    results = await crud.search_all(q.strip())
+    return ORJSONResponse({"results": results})
@@ -1,4 +1,5 @@
 """Application settings."""
+import os
 from pathlib import Path
 
 # Base directory
@@ -7,6 +8,18 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 # Database
 DATABASE_URL = f"sqlite+aiosqlite:///{BASE_DIR}/data/norsk_drill.db"
 
+# Connection pool (aiosqlite defaults to NullPool, i.e. a new connection per session)
+DB_POOL_SIZE = 10
+DB_MAX_OVERFLOW = 20
+
+# Per-connection SQLite tuning: memory-mapped reads and a 64 MB page cache
+SQLITE_MMAP_SIZE = 256 * 1024 * 1024
+SQLITE_CACHE_KB = 64 * 1024
+
+# Templates: compiled bytecode is cached on disk; set TEMPLATES_AUTO_RELOAD=1 while editing templates
+TEMPLATES_AUTO_RELOAD = os.getenv("TEMPLATES_AUTO_RELOAD", "0") == "1"
+TEMPLATE_CACHE_DIR = BASE_DIR / ".jinja_cache"
+
 # Personal mode (no authentication required)
 PERSONAL_MODE = True
 
@@ -0,0 +1,19 @@
+"""Shared Jinja2 environment for all routers."""
+from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
+from app import settings
+
+settings.TEMPLATE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+templates = Jinja2Templates(
+    directory="app/templates",
+    auto_reload=settings.TEMPLATES_AUTO_RELOAD,
+    cache_size=400,
+    bytecode_cache=FileSystemBytecodeCache(str(settings.TEMPLATE_CACHE_DIR)),
+)
+
+
+def preload():
+    """Compile every template at startup so no request pays for the first parse."""
+    for name in templates.env.list_templates(extensions=["html"]):
+        templates.get_template(name)